@@ -3,26 +3,43 @@
 
 """音訊重複器 - 音訊檔案重複播放和媒體管理工具"""
 
+import errno
+import functools
+import hashlib
 import math
 import os
+import queue
+import select
 import shutil
+import stat
+import struct
+import subprocess
+import sys
 import threading
 import time
+import wave
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from types import MappingProxyType
+from typing import AbstractSet, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import FreeSimpleGUI as sg
 import psutil
-from mutagen import File
-from mutagen.flac import FLAC
-from mutagen.mp3 import MP3
-from mutagen.mp4 import MP4
-from mutagen.oggvorbis import OggVorbis
-from mutagen.wave import WAVE
 
 # Constants - 程式常數設定
 MONITORING_INTERVAL = 2  # 媒體監控間隔時間（秒）
+USE_POLLING = not (sys.platform == 'win32' or   # 無系統事件通知的平台改用輪詢
+                   sys.platform.startswith('linux'))
+MOUNTS_FILE = '/proc/self/mounts'  # Linux 掛載表（掛載變化時可由 poll 得知）
+PARTITION_CACHE_TTL = 0.5  # 磁碟分區快照有效時間（秒）
 MAX_DISPLAY_ITEMS = 5    # 最大顯示項目數量
+MAX_DELETE_WORKERS = 8   # 清空媒體時的最大平行刪除執行緒數
+MAX_DRIVE_WORKERS = 4    # 批次模式同時處理的最大媒體數
+MAX_WRITE_WORKERS = 4    # 重複寫入區塊時的最大平行寫入執行緒數
+CALLBACK_BATCH_SIZE = 50        # 逐項刪除訊息累積幾則後合併回報一次
+CALLBACK_BATCH_INTERVAL = 0.1   # 逐項刪除訊息最長合併間隔（秒）
+_EMPTY_SET: frozenset = frozenset()  # 批次狀態回調共用的空集合
 DEFAULT_MP3_BITRATE = '192k'  # 預設MP3位元率
 THREAD_JOIN_TIMEOUT = 1  # 執行緒結束等待時間（秒）
 LABEL_WIDTH = 15         # 標籤寬度
@@ -32,7 +49,24 @@ COMBO_WIDTH = 25         # 下拉選單寬度
 
 # GUI Layout constants - 圖形界面佈局常數
 WINDOW_TITLE = '音訊轉檔重複器'  # 視窗標題
+EVENT_POLL_TIMEOUT = 16          # 有待處理更新時的幀間隔（毫秒，約 60 FPS；閒置時阻塞等待）
+OUTPUT_MAX_LINES = 500          # 輸出區最多保留的行數
+OUTPUT_TRIM_EVERY = 100          # 達上限後每新增幾行重繪一次以裁切舊內容
+COALESCED_EVENTS = frozenset({   # 每幀合併輸出、只重繪一次的背景事件
+    '-MEDIA_CHANGED-', '-BATCH_UPDATE-'
+})
+EMOJI_MAP = MappingProxyType({   # 批次事件類型對應的輸出圖示（唯讀）
+    'start': '🔄',
+    'progress': '⏳',
+    'info': '📋',
+    'warning': '⚠️',
+    'complete': '✅',
+    'error': '❌'
+})
+_DRIVE_FMT = '{device} ({free:.1f}GB free / {total:.1f}GB total)'.format_map  # 媒體選項顯示格式
 SUPPORTED_FORMATS = ['.wav', '.mp3', '.m4a', '.flac', '.ogg', '.aac', '.wma']  # 支援的音訊格式
+OUTPUT_FORMATS = ('mp3', 'wav', 'm4a', 'flac', 'ogg')  # 可選的輸出格式（下拉選單順序）
+_OUTPUT_FORMAT_SET = frozenset(OUTPUT_FORMATS)  # 輸出格式查詢用集合
 AUDIO_FILE_TYPES = (  # 檔案選擇對話框的檔案類型
     ('音訊檔案', '*.wav *.mp3 *.m4a *.flac *.ogg *.aac *.wma'),
 )
@@ -40,47 +74,197 @@ AUDIO_FILE_TYPES = (  # 檔案選擇對話框的檔案類型
 # FFmpeg constants - FFmpeg相關常數
 FFMPEG_EXE = 'ffmpeg.exe'        # FFmpeg執行檔名稱
 FFMPEG_TIMEOUT = 60              # FFmpeg執行逾時時間（秒）
+FFMPEG_THREADS = 0               # FFmpeg 編碼執行緒數（0 表示自動）
+FFMPEG_STDERR_TAIL = 50          # 失敗時保留的 FFmpeg 錯誤輸出行數
 PCM_S16LE_CODEC = 'pcm_s16le'    # PCM音訊編碼器
 LIBMP3LAME_CODEC = 'libmp3lame'  # MP3音訊編碼器
+FORMAT_MAP = {                   # 副檔名對應的 FFmpeg 封裝格式
+    'm4a': 'mp4',
+    'mp4': 'mp4',
+    'mp3': 'mp3',
+    'wav': 'wav',
+    'flac': 'flac',
+    'ogg': 'ogg'
+}
+_STREAMCOPY_PAIRS = frozenset(   # 封裝格式相同、可直接串流複製的副檔名組合
+    (src, dst) for src in FORMAT_MAP for dst in FORMAT_MAP
+    if FORMAT_MAP[src] == FORMAT_MAP[dst]
+)
+_MUXER_ARGS = {                  # 各封裝格式額外的輸出參數（MP4：moov 移至檔頭，可邊下載邊播放）
+    'mp4': ('-movflags', '+faststart')
+}
+STREAM_LOOP_EXCLUDED = frozenset({'aac'})  # -stream_loop 不可靠的格式（原始 ADTS），改用 concat 列表
+_TRANSCODE_ARGS = {              # 需轉檔時各輸出格式的編碼參數
+    'mp3': ('-c:a', LIBMP3LAME_CODEC, '-b:a', DEFAULT_MP3_BITRATE,
+            '-threads', str(FFMPEG_THREADS)),
+    'wav': ('-c:a', PCM_S16LE_CODEC, '-threads', str(FFMPEG_THREADS))
+}
+# Windows device notification constants - Windows 裝置通知常數
+WM_DESTROY = 0x0002
+WM_CLOSE = 0x0010
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+DBT_DEVTYP_DEVICEINTERFACE = 0x00000005
+DEVICE_NOTIFY_WINDOW_HANDLE = 0x00000000
+GUID_DEVINTERFACE_DISK = (0x53F56307, 0xB6BF, 0x11D0,  # 磁碟裝置介面 GUID
+                          (0x94, 0xF2, 0x00, 0xA0, 0xC9, 0x1E, 0xFB, 0x8B))
+NOTIFY_WINDOW_CLASS = 'AudioRepeaterDeviceNotify'  # 隱藏通知視窗類別名稱
+DRIVE_REMOVABLE = 2              # GetDriveTypeW：可移動磁碟（排除光碟機等）
 
 # Size conversion constants - 檔案大小轉換常數
 BYTES_TO_MB = 1024 * 1024        # 位元組轉MB
 BYTES_TO_GB = 1024 ** 3          # 位元組轉GB
+COPY_CHUNK_SIZE = 1024 * 1024    # 檔案複製區塊大小（1 MiB）
+COPY_QUEUE_DEPTH = 4             # 雙緩衝複製時預讀的區塊數
+COPY_RANGE_CHUNK = 16 * 1024 * 1024  # 核心內複製每次呼叫的位元組數（便於回報進度）
+VERIFY_HASH = 'blake2b'          # 複製驗證使用的雜湊演算法（標準庫中速度最快者）
+WAV_MAX_DATA_SIZE = 0xFFFFFFFF   # WAV 檔頭 32 位元長度欄位上限
+WAV_MAX_HEADER_CHUNKS = 16       # 快速解析 WAV 時長時最多略過的區塊數
+WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')  # 標準 44 位元組 PCM WAV 檔頭
+WAVE_FORMAT_PCM = 1              # fmt 區塊的 PCM 格式代碼
+
+# Stream concat constants - 直接串接音訊框架相關常數
+STREAM_CONCAT_FORMATS = frozenset({'mp3', 'aac'})  # 可直接串接位元組的格式
+ID3V1_TAG_SIZE = 128             # ID3v1 標籤長度
+MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128,   # MPEG1 Layer III（kbps）
+                   160, 192, 224, 256, 320)
+MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80,      # MPEG2/2.5 Layer III（kbps）
+                   96, 112, 128, 144, 160)
+MP3_SAMPLE_RATES = {             # 版本位元對應的取樣率
+    3: (44100, 48000, 32000),    # MPEG1
+    2: (22050, 24000, 16000),    # MPEG2
+    0: (11025, 12000, 8000),     # MPEG2.5
+}
+MP3_VBR_TAGS = (b'Xing', b'Info', b'VBRI')  # VBR/資訊標頭框架識別字
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_ffmpeg() -> Optional[str]:
+    """
+    尋找 FFmpeg 執行檔（全程式共用一次探測結果）
+
+    Returns:
+        FFmpeg 路徑；本地 ffmpeg.exe 優先，其次為 PATH 中的 'ffmpeg'，
+        找不到時返回 None。呼叫 _resolve_ffmpeg.cache_clear() 可重新探測。
+    """
+    local_ffmpeg = os.path.join(os.getcwd(), FFMPEG_EXE)
+    
+    if os.path.exists(local_ffmpeg):
+        return local_ffmpeg
+    if os.path.exists(FFMPEG_EXE):
+        return FFMPEG_EXE
+    if shutil.which('ffmpeg'):
+        return 'ffmpeg'
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _mutagen_loaders() -> Dict[str, type]:
+    """
+    副檔名對應的 mutagen 解析類別（免格式嗅探）
+
+    首次讀取音訊時長時才匯入 mutagen 各格式模組，加快程式啟動。
+    """
+    from mutagen.flac import FLAC
+    from mutagen.mp3 import MP3
+    from mutagen.mp4 import MP4
+    from mutagen.oggvorbis import OggVorbis
+    from mutagen.wave import WAVE
+
+    return {
+        '.mp3': MP3,
+        '.flac': FLAC,
+        '.m4a': MP4,
+        '.mp4': MP4,
+        '.ogg': OggVorbis,
+        '.wav': WAVE
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _audio_ext(file_path: str) -> str:
+    """檔案副檔名（小寫、不含句點），同一路徑重複查詢時直接取用快取"""
+    return os.path.splitext(file_path)[1][1:].lower()
 
 
 class RemovableMediaManager:
     """可移動媒體管理器"""
     
-    def __init__(self, callback=None):
+    def __init__(self, callback=None, copy_bufsize: int = COPY_CHUNK_SIZE):
         """
         初始化媒體管理器
         
         Args:
             callback: 媒體狀態改變時的回調函數
+            copy_bufsize: 串流複製時每個緩衝區的大小（位元組）
         """
         self.callback = callback
+        self.copy_bufsize = copy_bufsize
         self.known_drives: Set[str] = set()
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # 設定後監視循環立即結束
+        self._notify_hwnd: Optional[int] = None  # Windows 裝置通知視窗
+        self._wake_fd: Optional[int] = None      # Linux 掛載監視的喚醒管道
         self.batch_mode = False
         self.source_file: Optional[str] = None
+        # 批次模式下源檔案資訊快取（僅供進度訊息顯示）
+        self._source_basename: Optional[str] = None
+        self._source_size: Optional[int] = None
+        self._source_size_mb: Optional[float] = None
         self.processing_drives: Set[str] = set()
         self.completed_drives: Set[str] = set()
         self.auto_process_queue: List[str] = []
+        self._drive_executor: Optional[ThreadPoolExecutor] = None
+        self._drive_workers = MAX_DRIVE_WORKERS  # 批次模式同時處理的媒體數
+        self._state_lock = threading.Lock()  # 保護處理中／已完成磁碟機集合
+        self._copy_buffers = threading.local()  # 各執行緒重用的複製緩衝池
+        # 源檔案雜湊快取：(路徑, 修改時間, 檔案大小) → 雜湊值
+        self._hash_cache: Dict[tuple, str] = {}
+        # 批次模式源檔案的背景雜湊工作：(快取鍵, Future)
+        self._source_hash_job: Optional[Tuple[tuple, Future]] = None
+        # 分區快照：(時間戳記, 分區列表, 設備→分區, 可移動設備集合)
+        self._parts_cache: Tuple[float, List, Dict, Set[str]] = (
+            float('-inf'), [], {}, set()
+        )
         self.update_known_drives()
 
+    def _get_partitions(self, max_age: float = PARTITION_CACHE_TTL) -> List:
+        """
+        獲取磁碟分區快照，在有效時間內重複使用以減少系統呼叫
+        
+        Args:
+            max_age: 快照最長可用時間（秒），0 表示強制重新掃描
+            
+        Returns:
+            磁碟分區列表
+        """
+        return self._get_partition_snapshot(max_age)[1]
+
+    def _get_partition_snapshot(self, max_age: float = PARTITION_CACHE_TTL
+                                ) -> Tuple[float, List, Dict, Set[str]]:
+        """獲取分區快照，過期時重新掃描並建立查詢索引"""
+        snapshot = self._parts_cache
+        now = time.monotonic()
+        if now - snapshot[0] <= max_age:
+            return snapshot
+
+        partitions = psutil.disk_partitions(all=False)
+        by_device = {partition.device: partition for partition in partitions}
+        removable = {partition.device for partition in partitions
+                     if 'removable' in partition.opts}
+        snapshot = (now, partitions, by_device, removable)
+        self._parts_cache = snapshot
+        return snapshot
+
     def update_known_drives(self) -> None:
         """更新已知的磁碟機列表"""
-        current_drives = set()
-        for partition in psutil.disk_partitions():
-            if self._is_removable_partition(partition):
-                current_drives.add(partition.device)
-        self.known_drives = current_drives
+        self.known_drives = self._get_current_removable_drives(max_age=0)
 
     def _is_removable_partition(self, partition) -> bool:
         """檢查分區是否為可移動媒體"""
-        return ('removable' in partition.opts or 
-                self.is_removable_drive(partition.device))
+        return 'removable' in partition.opts
 
     def is_removable_drive(self, device: str) -> bool:
         """
@@ -93,12 +277,9 @@ class RemovableMediaManager:
             是否為可移動媒體
         """
         try:
-            for partition in psutil.disk_partitions():
-                if partition.device == device:
-                    return 'removable' in partition.opts
+            return device in self._get_partition_snapshot()[3]
         except (psutil.Error, OSError):
-            pass
-        return False
+            return False
 
     def get_removable_drives(self) -> List[Dict[str, Union[str, int]]]:
         """
@@ -107,8 +288,13 @@ class RemovableMediaManager:
         Returns:
             可移動磁碟機資訊列表
         """
+        if sys.platform == 'win32':
+            drives = self._get_removable_drives_win32()
+            if drives is not None:
+                return drives
+
         drives = []
-        for partition in psutil.disk_partitions():
+        for partition in self._get_partitions():
             if self._is_removable_partition(partition):
                 try:
                     usage = psutil.disk_usage(partition.mountpoint)
@@ -124,10 +310,76 @@ class RemovableMediaManager:
                     continue
         return drives
 
+    def _get_removable_drives_win32(self) -> Optional[List[Dict[str, Union[str, int]]]]:
+        """
+        以 GetLogicalDrives 位元遮罩列舉可移動磁碟機（Windows）
+
+        只對 DRIVE_REMOVABLE 類型的磁碟機查詢容量，未就緒（無媒體）
+        的磁碟機直接略過，不需列舉所有分區。
+
+        Returns:
+            可移動磁碟機資訊列表；無法使用 Win32 API 時返回 None
+        """
+        try:
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        except (ImportError, AttributeError, OSError):
+            return None
+
+        kernel32.GetLogicalDrives.restype = wintypes.DWORD
+        kernel32.GetDriveTypeW.argtypes = [wintypes.LPCWSTR]
+        kernel32.GetDriveTypeW.restype = wintypes.UINT
+        kernel32.GetDiskFreeSpaceExW.argtypes = [
+            wintypes.LPCWSTR, ctypes.POINTER(ctypes.c_ulonglong),
+            ctypes.POINTER(ctypes.c_ulonglong), ctypes.POINTER(ctypes.c_ulonglong)
+        ]
+        kernel32.GetDiskFreeSpaceExW.restype = wintypes.BOOL
+        kernel32.GetVolumeInformationW.argtypes = [
+            wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.DWORD, 
+            wintypes.LPDWORD, wintypes.LPDWORD, wintypes.LPDWORD,
+            wintypes.LPWSTR, wintypes.DWORD
+        ]
+        kernel32.GetVolumeInformationW.restype = wintypes.BOOL
+
+        drives = []
+        mask = kernel32.GetLogicalDrives()
+        for index in range(26):
+            if not mask & (1 << index):
+                continue
+            root = f'{chr(ord("A") + index)}:\\'
+            if kernel32.GetDriveTypeW(root) != DRIVE_REMOVABLE:
+                continue
+
+            free = ctypes.c_ulonglong()
+            total = ctypes.c_ulonglong()
+            if not kernel32.GetDiskFreeSpaceExW(root, None, ctypes.byref(total),
+                                                ctypes.byref(free)):
+                continue  # 磁碟機未就緒（讀卡機無卡片等）
+
+            fs_name = ctypes.create_unicode_buffer(32)
+            kernel32.GetVolumeInformationW(root, None, 0, None, None, None,
+                                           fs_name, len(fs_name))
+            drives.append({
+                'device': root,
+                'mountpoint': root,
+                'fstype': fs_name.value,
+                'total': total.value,
+                'free': free.value,
+                'used': total.value - free.value
+            })
+        return drives
+
     def start_monitoring(self) -> None:
         """開始監視媒體變化"""
         if not self.monitoring:
             self.monitoring = True
+            self._stop_event.clear()
+            if self._drive_executor is None:
+                self._drive_executor = ThreadPoolExecutor(
+                    max_workers=self._drive_workers,
+                    thread_name_prefix='drv'
+                )
             self.monitor_thread = threading.Thread(
                 target=self._monitor_loop, 
                 daemon=True
@@ -137,35 +389,232 @@ class RemovableMediaManager:
     def stop_monitoring(self) -> None:
         """停止監視媒體變化"""
         self.monitoring = False
+        self._stop_event.set()
+        if self._notify_hwnd:
+            import ctypes
+            ctypes.windll.user32.PostMessageW(self._notify_hwnd, WM_CLOSE, 0, 0)
+        if self._wake_fd is not None:
+            try:
+                os.write(self._wake_fd, b'\0')
+            except OSError:
+                pass
         if self.monitor_thread:
             self.monitor_thread.join(timeout=THREAD_JOIN_TIMEOUT)
+        self._shutdown_drive_executor()
+
+    def _shutdown_drive_executor(self) -> None:
+        """關閉磁碟機處理執行緒池（不等待進行中的複製，取消尚未開始的工作）"""
+        if self._drive_executor is not None:
+            if sys.version_info >= (3, 9):
+                self._drive_executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._drive_executor.shutdown(wait=False)
+            self._drive_executor = None
 
     def _monitor_loop(self) -> None:
         """監視媒體變化的主循環"""
-        while self.monitoring:
-            try:
-                current_drives = self._get_current_removable_drives()
-                new_drives, removed_drives = self._detect_drive_changes(
-                    current_drives
-                )
-                
-                if new_drives or removed_drives:
-                    self.known_drives = current_drives
-                    self._handle_drive_changes(new_drives)
-                    self._notify_drive_changes(new_drives, removed_drives)
+        if not USE_POLLING:
+            notify_loop = (self._device_notify_loop if sys.platform == 'win32'
+                           else self._mount_watch_loop)
+            if notify_loop():
+                return
+        # 不支援事件通知的平台或註冊通知失敗時退回輪詢
+        while not self._stop_event.is_set():
+            self._scan_for_changes()
+            if self._stop_event.wait(MONITORING_INTERVAL):
+                break
 
-            except Exception:
-                pass  # 忽略錯誤，繼續監視
+    def _scan_for_changes(self) -> None:
+        """重新掃描磁碟機並處理變化"""
+        try:
+            current_drives = self._get_current_removable_drives(max_age=0)
+            new_drives, removed_drives = self._detect_drive_changes(
+                current_drives
+            )
+            
+            if new_drives or removed_drives:
+                self.known_drives = current_drives
+                self._handle_drive_changes(new_drives)
+                self._notify_drive_changes(new_drives, removed_drives)
+
+        except Exception:
+            pass  # 忽略錯誤，繼續監視
+
+    def _mount_watch_loop(self) -> bool:
+        """
+        以掛載表變化事件驅動監視媒體變化（僅限 Linux）
+
+        核心在掛載或卸載時會讓 /proc/self/mounts 回報 POLLPRI，
+        只在此時重新掃描；媒體插入後要等自動掛載完成才會出現在
+        分區列表中，因此監看掛載表比監看區塊裝置更準確。
+
+        Returns:
+            是否成功進入事件循環；False 表示應退回輪詢
+        """
+        if not hasattr(select, 'poll'):
+            return False
+        try:
+            mounts = open(MOUNTS_FILE, 'rb')
+        except OSError:
+            return False
+
+        wake_r, wake_w = os.pipe()
+        poller = select.poll()
+        poller.register(mounts.fileno(), select.POLLERR | select.POLLPRI)
+        poller.register(wake_r, select.POLLIN)
+        self._wake_fd = wake_w
+        try:
+            # 補掃監看開始前可能已掛載的媒體
+            self._scan_for_changes()
+            while not self._stop_event.is_set():
+                events = poller.poll()
+                if any(fd == wake_r for fd, _ in events):
+                    break
+                self._scan_for_changes()
+            return True
+        finally:
+            self._wake_fd = None
+            os.close(wake_r)
+            os.close(wake_w)
+            mounts.close()
+
+    def _device_notify_loop(self) -> bool:
+        """
+        以 WM_DEVICECHANGE 事件驅動監視媒體變化（僅限 Windows）
+
+        建立隱藏的頂層視窗並註冊磁碟裝置介面通知，只在裝置插入或
+        移除時才重新掃描，閒置時不佔用 CPU。
+
+        Returns:
+            是否成功進入訊息循環；False 表示應退回輪詢
+        """
+        try:
+            import ctypes
+            from ctypes import wintypes
+        except ImportError:
+            return False
+
+        user32 = ctypes.WinDLL('user32', use_last_error=True)
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT,
+                                     wintypes.WPARAM, wintypes.LPARAM)
+
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [('style', wintypes.UINT),
+                        ('lpfnWndProc', WNDPROC),
+                        ('cbClsExtra', ctypes.c_int),
+                        ('cbWndExtra', ctypes.c_int),
+                        ('hInstance', wintypes.HINSTANCE),
+                        ('hIcon', wintypes.HICON),
+                        ('hCursor', wintypes.HANDLE),
+                        ('hbrBackground', wintypes.HBRUSH),
+                        ('lpszMenuName', wintypes.LPCWSTR),
+                        ('lpszClassName', wintypes.LPCWSTR)]
+
+        class GUID(ctypes.Structure):
+            _fields_ = [('Data1', wintypes.DWORD),
+                        ('Data2', wintypes.WORD),
+                        ('Data3', wintypes.WORD),
+                        ('Data4', ctypes.c_ubyte * 8)]
+
+        class DEV_BROADCAST_DEVICEINTERFACE_W(ctypes.Structure):
+            _fields_ = [('dbcc_size', wintypes.DWORD),
+                        ('dbcc_devicetype', wintypes.DWORD),
+                        ('dbcc_reserved', wintypes.DWORD),
+                        ('dbcc_classguid', GUID),
+                        ('dbcc_name', wintypes.WCHAR * 1)]
+
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT,
+                                          wintypes.WPARAM, wintypes.LPARAM]
+        user32.DefWindowProcW.restype = LRESULT
+        user32.RegisterClassW.argtypes = [ctypes.POINTER(WNDCLASSW)]
+        user32.RegisterClassW.restype = wintypes.ATOM
+        user32.UnregisterClassW.argtypes = [wintypes.LPCWSTR, wintypes.HINSTANCE]
+        user32.CreateWindowExW.argtypes = [
+            wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID
+        ]
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.DestroyWindow.argtypes = [wintypes.HWND]
+        user32.RegisterDeviceNotificationW.argtypes = [
+            wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD
+        ]
+        user32.RegisterDeviceNotificationW.restype = wintypes.HANDLE
+        user32.UnregisterDeviceNotification.argtypes = [wintypes.HANDLE]
+        user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG),
+                                       wintypes.HWND, wintypes.UINT,
+                                       wintypes.UINT]
+        user32.GetMessageW.restype = wintypes.BOOL
+        user32.TranslateMessage.argtypes = [ctypes.POINTER(wintypes.MSG)]
+        user32.DispatchMessageW.argtypes = [ctypes.POINTER(wintypes.MSG)]
+        kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg == WM_DEVICECHANGE and wparam in (DBT_DEVICEARRIVAL,
+                                                     DBT_DEVICEREMOVECOMPLETE):
+                self._scan_for_changes()
+            elif msg == WM_DESTROY:
+                user32.PostQuitMessage(0)
+                return 0
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+        proc = WNDPROC(wnd_proc)  # 保留參照，避免回呼被回收
+        h_instance = kernel32.GetModuleHandleW(None)
+        wndclass = WNDCLASSW(lpfnWndProc=proc, hInstance=h_instance,
+                             lpszClassName=NOTIFY_WINDOW_CLASS)
+        if not user32.RegisterClassW(ctypes.byref(wndclass)):
+            return False
+
+        # 使用隱藏頂層視窗（非 HWND_MESSAGE），才能同時收到磁碟區廣播
+        hwnd = user32.CreateWindowExW(0, NOTIFY_WINDOW_CLASS, WINDOW_TITLE, 0,
+                                      0, 0, 0, 0, None, None, h_instance, None)
+        if not hwnd:
+            user32.UnregisterClassW(NOTIFY_WINDOW_CLASS, h_instance)
+            return False
+
+        data1, data2, data3, data4 = GUID_DEVINTERFACE_DISK
+        dev_filter = DEV_BROADCAST_DEVICEINTERFACE_W(
+            dbcc_size=ctypes.sizeof(DEV_BROADCAST_DEVICEINTERFACE_W),
+            dbcc_devicetype=DBT_DEVTYP_DEVICEINTERFACE,
+            dbcc_classguid=GUID(data1, data2, data3,
+                                (ctypes.c_ubyte * 8)(*data4))
+        )
+        h_notify = user32.RegisterDeviceNotificationW(
+            hwnd, ctypes.byref(dev_filter), DEVICE_NOTIFY_WINDOW_HANDLE
+        )
+        if not h_notify:
+            user32.DestroyWindow(hwnd)
+            user32.UnregisterClassW(NOTIFY_WINDOW_CLASS, h_instance)
+            return False
 
-            time.sleep(MONITORING_INTERVAL)
+        self._notify_hwnd = hwnd
+        try:
+            if not self.monitoring:
+                return True
+            # 補掃註冊前可能已插入的媒體
+            self._scan_for_changes()
+
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+            return True
+        finally:
+            self._notify_hwnd = None
+            user32.UnregisterDeviceNotification(h_notify)
+            user32.DestroyWindow(hwnd)
+            user32.UnregisterClassW(NOTIFY_WINDOW_CLASS, h_instance)
 
-    def _get_current_removable_drives(self) -> Set[str]:
+    def _get_current_removable_drives(self, max_age: float = PARTITION_CACHE_TTL
+                                      ) -> Set[str]:
         """獲取當前可移動磁碟機集合"""
-        current_drives = set()
-        for partition in psutil.disk_partitions():
-            if self._is_removable_partition(partition):
-                current_drives.add(partition.device)
-        return current_drives
+        return {partition.device
+                for partition in self._get_partitions(max_age)
+                if self._is_removable_partition(partition)}
 
     def _detect_drive_changes(self, current_drives: Set[str]) -> Tuple[Set[str], Set[str]]:
         """偵測磁碟機變化"""
@@ -175,36 +624,38 @@ class RemovableMediaManager:
 
     def _handle_drive_changes(self, new_drives: Set[str]) -> None:
         """處理新插入的磁碟機"""
-        if not (self.batch_mode and new_drives and self.source_file):
+        executor = self._drive_executor
+        if not (self.batch_mode and new_drives and self.source_file and executor):
             return
             
         for drive in new_drives:
-            if self._should_process_drive(drive):
+            if self._claim_drive(drive):
                 self.auto_process_queue.append(drive)
-                thread = threading.Thread(
-                    target=self._auto_process_drive,
-                    args=(drive,),
-                    daemon=True
-                )
-                thread.start()
+                executor.submit(self._auto_process_drive, drive)
 
-    def _should_process_drive(self, drive: str) -> bool:
-        """檢查是否應該處理該磁碟機"""
-        return (drive not in self.processing_drives and 
-                drive not in self.completed_drives)
+    def _claim_drive(self, drive: str) -> bool:
+        """檢查並標記磁碟機為處理中（原子操作，避免同一磁碟機被重複處理）"""
+        with self._state_lock:
+            if (drive in self.processing_drives or 
+                    drive in self.completed_drives):
+                return False
+            self.processing_drives.add(drive)
+            return True
 
     def _notify_drive_changes(self, new_drives: Set[str], removed_drives: Set[str]) -> None:
         """通知磁碟機變化"""
         if self.callback:
             self.callback(new_drives, removed_drives)
 
-    def clear_drive(self, drive_path: str, callback=None) -> Tuple[bool, str]:
+    def clear_drive(self, drive_path: str, callback=None,
+                    max_workers: int = MAX_DELETE_WORKERS) -> Tuple[bool, str]:
         """
         清空磁碟機（刪除所有檔案和資料夾）
         
         Args:
             drive_path: 磁碟機路徑
             callback: 進度回調函數
+            max_workers: 平行刪除的最大執行緒數（HDD 類媒體建議設為 2）
             
         Returns:
             (成功狀態, 訊息)
@@ -213,13 +664,13 @@ class RemovableMediaManager:
             return False, "磁碟機不存在"
 
         try:
-            items = self._scan_drive_items(drive_path, callback)
-            if not items:
+            entries = self._scan_drive_items(drive_path, callback)
+            if not entries:
                 if callback:
                     callback('info', f"磁碟機 {drive_path} 已經是空的")
                 return True, "磁碟機已經是空的"
 
-            return self._delete_items(drive_path, items, callback)
+            return self._delete_items(drive_path, entries, callback, max_workers)
 
         except Exception as e:
             return False, f"清理失敗：{str(e)}"
@@ -228,26 +679,29 @@ class RemovableMediaManager:
         """驗證磁碟機路徑"""
         return os.path.exists(drive_path)
 
-    def _scan_drive_items(self, drive_path: str, callback) -> List[str]:
-        """掃描磁碟機項目"""
+    def _scan_drive_items(self, drive_path: str, callback) -> List[os.DirEntry]:
+        """掃描磁碟機項目（單次 scandir，項目類型資訊由系統一併返回）"""
         try:
-            items = os.listdir(drive_path)
+            with os.scandir(drive_path) as it:
+                entries = list(it)
         except Exception as e:
             raise Exception(f"無法讀取磁碟機內容：{str(e)}")
 
-        if callback and items:
-            self._report_scan_results(items, drive_path, callback)
+        if callback and entries:
+            self._report_scan_results(entries, callback)
 
-        return items
+        return entries
 
-    def _report_scan_results(self, items: List[str], drive_path: str, callback) -> None:
+    def _report_scan_results(self, entries: List[os.DirEntry], callback) -> None:
         """報告掃描結果"""
-        files, folders = self._categorize_items(items, drive_path)
+        files, folders = self._categorize_items(entries)
         total_items = len(files) + len(folders)
+        total_bytes = self._sum_file_sizes(entries)
         
         callback('info', 
                 f"掃描完成：找到 {len(files)} 個檔案，"
-                f"{len(folders)} 個資料夾（共 {total_items} 項）")
+                f"{len(folders)} 個資料夾（共 {total_items} 項，"
+                f"檔案共 {total_bytes / BYTES_TO_MB:.1f} MB）")
 
         if files:
             file_display = self._format_item_list(files, "檔案")
@@ -259,17 +713,16 @@ class RemovableMediaManager:
 
         callback('info', "開始清理...")
 
-    def _categorize_items(self, items: List[str], drive_path: str) -> Tuple[List[str], List[str]]:
-        """將項目分類為檔案和資料夾"""
+    def _categorize_items(self, entries: List[os.DirEntry]) -> Tuple[List[str], List[str]]:
+        """將項目分類為檔案和資料夾名稱"""
         files = []
         folders = []
         
-        for item in items:
-            item_path = os.path.join(drive_path, item)
-            if os.path.isfile(item_path):
-                files.append(item)
-            elif os.path.isdir(item_path):
-                folders.append(item)
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                files.append(entry.name)
+            elif entry.is_dir(follow_symlinks=False):
+                folders.append(entry.name)
                 
         return files, folders
 
@@ -282,39 +735,76 @@ class RemovableMediaManager:
         remaining_count = len(items) - MAX_DISPLAY_ITEMS
         return f"{item_type}：{visible_items} ...（還有{remaining_count}個）"
 
-    def _delete_items(self, drive_path: str, items: List[str], callback) -> Tuple[bool, str]:
-        """刪除項目"""
+    def _delete_items(self, drive_path: str, entries: List[os.DirEntry], 
+                      callback, max_workers: int = MAX_DELETE_WORKERS
+                      ) -> Tuple[bool, str]:
+        """
+        平行刪除項目（回調僅在呼叫端執行緒中依完成順序觸發）
+        
+        同類型的逐項訊息累積至 CALLBACK_BATCH_SIZE 則或 CALLBACK_BATCH_INTERVAL
+        秒後才以多行文字合併回報一次，避免大量小檔案時塞滿 GUI 事件佇列。
+        """
         deleted_count = 0
         failed_items = []
-
-        for item in items:
-            success = self._delete_single_item(drive_path, item, callback)
-            if success:
-                deleted_count += 1
-            else:
-                failed_items.append(item)
+        pending: List[str] = []
+        pending_type = None
+        last_flush = time.monotonic()
+
+        def flush():
+            nonlocal pending_type, last_flush
+            if pending:
+                callback(pending_type, '\n'.join(pending))
+                pending.clear()
+            pending_type = None
+            last_flush = time.monotonic()
+
+        max_workers = max(1, min(max_workers, len(entries)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._delete_single_item, entry): entry.name
+                for entry in entries
+            }
+            for future in as_completed(futures):
+                success, msg_type, message = future.result()
+                if callback:
+                    if msg_type != pending_type:
+                        flush()
+                        pending_type = msg_type
+                    pending.append(message)
+                    if (len(pending) >= CALLBACK_BATCH_SIZE or 
+                            time.monotonic() - last_flush >= CALLBACK_BATCH_INTERVAL):
+                        flush()
+                if success:
+                    deleted_count += 1
+                else:
+                    failed_items.append(futures[future])
+            if callback:
+                flush()
 
         return self._finalize_deletion(
-            drive_path, deleted_count, len(items), failed_items, callback
+            drive_path, deleted_count, len(entries), failed_items, callback
         )
 
-    def _delete_single_item(self, drive_path: str, item: str, callback) -> bool:
-        """刪除單個項目"""
-        item_path = os.path.join(drive_path, item)
+    def _delete_single_item(self, entry: os.DirEntry) -> Tuple[bool, str, str]:
+        """
+        刪除單個項目（於工作執行緒中執行）
+        
+        Returns:
+            (成功狀態, 訊息類型, 訊息)
+        """
+        item = entry.name
         try:
-            if os.path.isfile(item_path):
-                os.remove(item_path)
-                if callback:
-                    callback('progress', f"已刪除檔案：{item}")
-            elif os.path.isdir(item_path):
-                shutil.rmtree(item_path)
-                if callback:
-                    callback('progress', f"已刪除資料夾：{item}")
-            return True
+            if entry.is_dir(follow_symlinks=False):
+                errors = []
+                shutil.rmtree(entry.path,
+                              onerror=lambda func, path, exc: errors.append(exc[1]))
+                if errors:
+                    return False, 'warning', f"無法刪除 {item}：{str(errors[0])}"
+                return True, 'progress', f"已刪除資料夾：{item}"
+            os.remove(entry.path)
+            return True, 'progress', f"已刪除檔案：{item}"
         except Exception as e:
-            if callback:
-                callback('warning', f"無法刪除 {item}：{str(e)}")
-            return False
+            return False, 'warning', f"無法刪除 {item}：{str(e)}"
 
     def _finalize_deletion(self, drive_path: str, deleted_count: int, 
                           total_items: int, failed_items: List[str], 
@@ -334,19 +824,37 @@ class RemovableMediaManager:
     def _check_remaining_items(self, drive_path: str, callback) -> List[str]:
         """檢查剩餘項目"""
         try:
-            remaining_items = os.listdir(drive_path)
+            with os.scandir(drive_path) as it:
+                entries = list(it)
+            remaining_items = [entry.name for entry in entries]
             if remaining_items and callback:
+                remaining_bytes = self._sum_file_sizes(entries)
                 remaining_display = ', '.join(remaining_items[:3])
                 if len(remaining_items) > 3:
                     remaining_display += "..."
                 callback('warning', 
-                        f"仍有 {len(remaining_items)} 個項目未被刪除：{remaining_display}")
+                        f"仍有 {len(remaining_items)} 個項目未被刪除"
+                        f"（檔案共 {remaining_bytes / BYTES_TO_MB:.1f} MB）："
+                        f"{remaining_display}")
             return remaining_items
         except Exception:
             return []
 
+    def _sum_file_sizes(self, entries: List[os.DirEntry]) -> int:
+        """加總目錄項目中檔案的大小（使用 DirEntry 快取的 stat 結果）"""
+        total = 0
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+        return total
+
     def copy_file_to_drive(self, source_file: str, drive_path: str, 
-                          filename: Optional[str] = None) -> Tuple[bool, str]:
+                          filename: Optional[str] = None,
+                          progress_callback: Optional[Callable[[int, int], None]] = None
+                          ) -> Tuple[bool, str]:
         """
         複製檔案到磁碟機
         
@@ -354,40 +862,268 @@ class RemovableMediaManager:
             source_file: 源檔案路徑
             drive_path: 目標磁碟機路徑
             filename: 目標檔案名（可選）
+            progress_callback: 進度回調函數，參數為 (已複製位元組, 總位元組)
             
         Returns:
             (成功狀態, 訊息)
         """
         try:
-            if not os.path.exists(source_file):
+            try:
+                source_st = os.stat(source_file)
+            except OSError:
+                return False, "源檔案不存在"
+            if not stat.S_ISREG(source_st.st_mode):
                 return False, "源檔案不存在"
-
-            if not os.path.exists(drive_path):
-                return False, "目標磁碟機不存在"
 
             if filename is None:
                 filename = os.path.basename(source_file)
 
             target_path = os.path.join(drive_path, filename)
-            shutil.copy2(source_file, target_path)
-
-            return self._verify_copy(source_file, target_path)
+            try:
+                return self._copy_and_verify(source_file, target_path, 
+                                             progress_callback)
+            except FileNotFoundError:
+                # 源檔案已確認存在，開啟目標失敗表示磁碟機（目錄）不存在
+                if not os.path.isdir(drive_path):
+                    return False, "目標磁碟機不存在"
+                raise
 
         except Exception as e:
             return False, f"複製失敗：{str(e)}"
 
-    def _verify_copy(self, source_file: str, target_path: str) -> Tuple[bool, str]:
-        """驗證檔案複製"""
-        if not os.path.exists(target_path):
-            return False, "檔案複製失敗"
-
-        source_size = os.path.getsize(source_file)
-        target_size = os.path.getsize(target_path)
+    def _copy_and_verify(self, source_file: str, target_path: str,
+                         progress_callback: Optional[Callable[[int, int], None]] = None
+                         ) -> Tuple[bool, str]:
+        """
+        串流複製檔案，並在同一次讀取中驗證寫入完整性
+        
+        源檔案大小與修改時間一律取自實際複製的檔案描述符，
+        避免源檔案在批次模式啟用後被改寫時只複製舊長度。
         
-        if source_size == target_size:
-            return True, f"檔案成功複製到 {target_path}"
+        Args:
+            source_file: 源檔案路徑
+            target_path: 目標檔案路徑
+            progress_callback: 進度回調函數（可選）
+            
+        Returns:
+            (成功狀態, 訊息)
+        """
+        if sys.platform == 'win32' and self._copy_file_ex(source_file, 
+                                                          target_path,
+                                                          progress_callback):
+            # 系統複製路徑（重疊 I/O），完成後仍落盤並核對大小
+            source_size = os.stat(source_file).st_size
+            with open(target_path, 'r+b', buffering=0) as dst:
+                os.fsync(dst.fileno())
+                target_size = os.fstat(dst.fileno()).st_size
+            written = target_size
         else:
+            with open(source_file, 'rb', buffering=0) as src, \
+                    open(target_path, 'wb', buffering=0) as dst:
+                src_st = os.fstat(src.fileno())
+                source_size = src_st.st_size
+                # 先嘗試核心內複製，不支援時由目前位置接續串流複製
+                written = self._copy_file_range(src.fileno(), dst.fileno(), 
+                                                source_size, progress_callback)
+                if written < source_size:
+                    written += self._sendfile_copy(src.fileno(), dst.fileno(),
+                                                   written, source_size,
+                                                   progress_callback)
+                digest = None
+                hash_key = (source_file, src_st.st_mtime_ns, source_size)
+                if written < source_size:
+                    # 整個檔案都經由使用者空間複製時，順便計算源檔案雜湊供驗證使用
+                    if written == 0 and hash_key not in self._hash_cache:
+                        digest = hashlib.new(VERIFY_HASH)
+                    written += self._copy_double_buffered(
+                        src, dst, written, source_size, progress_callback,
+                        digest)
+                os.fsync(dst.fileno())
+                target_size = os.fstat(dst.fileno()).st_size
+                if digest is not None and written == source_size:
+                    self._hash_cache[hash_key] = digest.hexdigest()
+
+        shutil.copystat(source_file, target_path)
+
+        if written != source_size or target_size != source_size:
             return False, "檔案複製不完整"
+        return True, f"檔案成功複製到 {target_path}"
+
+    def _copy_file_range(self, src_fd: int, dst_fd: int, size: int,
+                         progress_callback: Optional[Callable[[int, int], None]] = None
+                         ) -> int:
+        """
+        以 os.copy_file_range 在核心內複製（Linux），返回已複製位元組數
+
+        不支援（舊核心、跨檔案系統等）時返回目前已複製的數量，
+        由呼叫端從檔案目前位置接續複製。
+        """
+        if not hasattr(os, 'copy_file_range'):
+            return 0
+        copied = 0
+        while copied < size:
+            try:
+                n = os.copy_file_range(src_fd, dst_fd, 
+                                       min(size - copied, COPY_RANGE_CHUNK))
+            except OSError as e:
+                if e.errno in (errno.ENOSYS, errno.EXDEV, errno.EINVAL,
+                               errno.EOPNOTSUPP, errno.EPERM, errno.EBADF):
+                    break
+                raise
+            if n == 0:
+                break
+            copied += n
+            if progress_callback:
+                progress_callback(copied, size)
+        return copied
+
+    def _sendfile_copy(self, src_fd: int, dst_fd: int, offset: int, size: int,
+                       progress_callback: Optional[Callable[[int, int], None]] = None
+                       ) -> int:
+        """
+        以 os.sendfile 由核心直接複製（POSIX），返回本次複製的位元組數
+
+        用於 copy_file_range 不可用時（舊核心、舊版 Python）；不支援時
+        返回目前已複製的數量，並將來源位置移到已複製處以便接續。
+        """
+        if sys.platform == 'win32' or not hasattr(os, 'sendfile'):
+            return 0
+        copied = 0
+        while offset + copied < size:
+            try:
+                n = os.sendfile(dst_fd, src_fd, offset + copied,
+                                min(size - offset - copied, COPY_RANGE_CHUNK))
+            except OSError as e:
+                if e.errno in (errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK,
+                               errno.EOPNOTSUPP):
+                    break
+                raise
+            if n == 0:
+                break
+            copied += n
+            if progress_callback:
+                progress_callback(offset + copied, size)
+        if copied:
+            # 指定位移的 sendfile 不會移動來源檔案位置
+            os.lseek(src_fd, offset + copied, os.SEEK_SET)
+        return copied
+
+    def _copy_double_buffered(self, src, dst, copied: int, total: int,
+                              progress_callback: Optional[Callable[[int, int], None]] = None,
+                              digest=None) -> int:
+        """
+        雙緩衝串流複製：讀取執行緒預先讀入區塊，與目標寫入重疊進行
+        
+        Args:
+            src: 來源檔案（無緩衝）
+            dst: 目標檔案（無緩衝）
+            copied: 先前已複製的位元組數（用於回報進度）
+            total: 檔案總位元組數
+            progress_callback: 進度回調函數（可選）
+            digest: hashlib 雜湊物件（可選），寫入的每個區塊同時更新雜湊
+            
+        Returns:
+            本次寫入的位元組數
+        """
+        free = self._get_copy_buffers()
+        chunks = queue.Queue()  # 數量受緩衝池大小限制
+        stop = threading.Event()
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    try:
+                        buf = free.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    n = src.readinto(buf)
+                    chunks.put((buf, n))
+                    if not n:
+                        return
+            except Exception as e:
+                chunks.put(e)
+
+        reader_thread = threading.Thread(target=reader, daemon=True)
+        reader_thread.start()
+        written = 0
+        try:
+            while True:
+                item = chunks.get()
+                if isinstance(item, Exception):
+                    raise item
+                buf, n = item
+                if not n:
+                    free.put(buf)
+                    break
+                view = memoryview(buf)[:n]
+                written += self._write_chunk(dst, view)
+                if digest is not None:
+                    digest.update(view)
+                free.put(buf)
+                if progress_callback:
+                    progress_callback(copied + written, total)
+        finally:
+            stop.set()
+            reader_thread.join()
+            # 歸還仍在佇列中的緩衝區，供下次複製重用
+            while not chunks.empty():
+                item = chunks.get_nowait()
+                if not isinstance(item, Exception):
+                    free.put(item[0])
+        return written
+
+    def _get_copy_buffers(self) -> queue.Queue:
+        """
+        取得目前執行緒的複製緩衝池（預先配置，跨次複製重用）
+
+        緩衝區數量為預讀深度加上讀取與寫入各持有的一個。每個執行緒
+        各自一組，批次模式多個磁碟機同時複製時不會共用。
+        """
+        pool = getattr(self._copy_buffers, 'pool', None)
+        if pool is None:
+            pool = queue.Queue()
+            for _ in range(COPY_QUEUE_DEPTH + 2):
+                pool.put(bytearray(self.copy_bufsize))
+            self._copy_buffers.pool = pool
+        return pool
+
+    def _copy_file_ex(self, source_file: str, target_path: str,
+                      progress_callback: Optional[Callable[[int, int], None]] = None
+                      ) -> bool:
+        """以 CopyFileExW 複製檔案（Windows），失敗時返回 False"""
+        try:
+            import ctypes
+            from ctypes import wintypes
+            kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+            PROGRESS_ROUTINE = ctypes.WINFUNCTYPE(
+                wintypes.DWORD, ctypes.c_longlong, ctypes.c_longlong,
+                ctypes.c_longlong, ctypes.c_longlong, wintypes.DWORD,
+                wintypes.DWORD, wintypes.HANDLE, wintypes.HANDLE,
+                wintypes.LPVOID
+            )
+            copy_file_ex = kernel32.CopyFileExW
+            copy_file_ex.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR,
+                                     PROGRESS_ROUTINE, wintypes.LPVOID,
+                                     wintypes.LPVOID, wintypes.DWORD]
+            copy_file_ex.restype = wintypes.BOOL
+
+            def on_progress(total, transferred, *_):
+                if progress_callback:
+                    progress_callback(transferred, total)
+                return 0  # PROGRESS_CONTINUE
+
+            routine = PROGRESS_ROUTINE(on_progress)
+            return bool(copy_file_ex(source_file, target_path,
+                                     routine, None, None, 0))
+        except (ImportError, AttributeError, OSError):
+            return False
+
+    def _write_chunk(self, dst, data) -> int:
+        """完整寫入資料區塊（處理部分寫入），返回寫入位元組數"""
+        view = memoryview(data)
+        while view:
+            view = view[dst.write(view):]
+        return len(data)
 
     def verify_file(self, source_file: str, target_file: str) -> Tuple[bool, str]:
         """
@@ -401,36 +1137,145 @@ class RemovableMediaManager:
             (成功狀態, 訊息)
         """
         try:
-            if not os.path.exists(target_file):
+            try:
+                target_size = os.stat(target_file).st_size
+            except FileNotFoundError:
                 return False, "目標檔案不存在"
-
-            source_size = os.path.getsize(source_file)
-            target_size = os.path.getsize(target_file)
+            source_st = os.stat(source_file)  # 每次重新查詢，源檔案可能已被改寫
+            source_size = source_st.st_size
 
             if source_size != target_size:
                 return False, (f"檔案大小不符：原檔 {source_size} bytes，"
                              f"目標檔 {target_size} bytes")
 
+            # 大小相符後再比對內容雜湊；源檔案雜湊已快取時只需讀取目標檔
+            key = (source_file, source_st.st_mtime_ns, source_size)
+            source_hash = self._hash_cache.get(key)
+            job = self._source_hash_job
+            if source_hash is None and job is not None and job[0] == key:
+                try:
+                    source_hash = job[1].result()  # 等待背景預先計算的結果
+                except Exception:
+                    # 預先計算失敗（如源檔案暫時無法讀取）時清除該工作，
+                    # 改為下方同時計算，避免後續每個磁碟機都沿用失敗結果
+                    if self._source_hash_job is job:
+                        self._source_hash_job = None
+            if source_hash is None:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    source_future = executor.submit(self._hash_file, source_file)
+                    target_hash = self._hash_file(target_file, drop_cache=True)
+                    source_hash = source_future.result()
+                self._hash_cache[key] = source_hash
+            else:
+                target_hash = self._hash_file(target_file, drop_cache=True)
+
+            if source_hash != target_hash:
+                return False, "檔案內容不符：雜湊值驗證失敗"
+
             return True, "檔案驗證成功"
 
         except Exception as e:
             return False, f"驗證失敗：{str(e)}"
 
-    def set_batch_mode(self, enabled: bool, source_file: Optional[str] = None) -> None:
+    def _hash_file(self, path: str, drop_cache: bool = False) -> str:
+        """
+        以串流方式計算檔案雜湊（重用預先配置的緩衝區）
+        
+        Args:
+            path: 檔案路徑
+            drop_cache: 是否先丟棄該檔案的頁面快取，確保實際從媒體讀回
+            
+        Returns:
+            十六進位雜湊字串
+        """
+        digest = hashlib.new(VERIFY_HASH)
+        buf = bytearray(self.copy_bufsize)
+        view = memoryview(buf)
+        with open(path, 'rb', buffering=0) as f:
+            if drop_cache and hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                digest.update(view[:n])
+        return digest.hexdigest()
+
+    def set_batch_mode(self, enabled: bool, source_file: Optional[str] = None,
+                       max_workers: int = MAX_DRIVE_WORKERS) -> None:
         """
         設定批次處理模式
         
         Args:
             enabled: 是否啟用批次模式
             source_file: 源檔案路徑
+            max_workers: 同時處理的最大媒體數（HDD 類媒體建議調低）
         """
+        max_workers = max(1, max_workers)
+        if max_workers != self._drive_workers:
+            self._drive_workers = max_workers
+            if self._drive_executor is not None:
+                # 依新的數量重建執行緒池；進行中的複製仍會完成
+                self._drive_executor.shutdown(wait=False)
+                self._drive_executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix='drv'
+                )
         self.batch_mode = enabled
         self.source_file = source_file
+        self._cache_source_info(source_file if enabled else None)
+        if enabled and source_file:
+            self._prime_source_hash(source_file)
         if not enabled:
-            self.processing_drives.clear()
-            self.completed_drives.clear()
+            with self._state_lock:
+                self.processing_drives.clear()
+                self.completed_drives.clear()
             self.auto_process_queue.clear()
 
+    def _cache_source_info(self, source_file: Optional[str]) -> None:
+        """快取源檔案名稱與大小（僅供進度訊息顯示，複製與驗證時一律重新查詢）"""
+        self._source_basename = None
+        self._source_size = None
+        self._source_size_mb = None
+        if not source_file:
+            return
+        try:
+            st = os.stat(source_file)
+        except OSError:
+            return
+        size = st.st_size
+        self._source_basename = os.path.basename(source_file)
+        self._source_size = size
+        self._source_size_mb = size / BYTES_TO_MB
+
+    def _prime_source_hash(self, source_file: str) -> None:
+        """於背景預先計算源檔案雜湊，各磁碟機驗證時只需讀取目標檔"""
+        try:
+            st = os.stat(source_file)
+        except OSError:
+            return
+        key = (source_file, st.st_mtime_ns, st.st_size)
+        job = self._source_hash_job
+        if key in self._hash_cache or (job is not None and job[0] == key):
+            return
+
+        future: Future = Future()
+        self._source_hash_job = (key, future)
+
+        def worker():
+            try:
+                digest = self._hash_file(source_file)
+            except Exception as e:
+                future.set_exception(e)
+                return
+            self._hash_cache[key] = digest
+            future.set_result(digest)
+
+        threading.Thread(target=worker, daemon=True, name='hash').start()
+
     def _auto_process_drive(self, drive_device: str) -> None:
         """
         自動處理單個磁碟機的完整流程
@@ -439,7 +1284,6 @@ class RemovableMediaManager:
             drive_device: 磁碟機設備名
         """
         try:
-            self.processing_drives.add(drive_device)
             drive_path = self._get_drive_path(drive_device)
             
             if not drive_path:
@@ -453,14 +1297,13 @@ class RemovableMediaManager:
             self._notify_callback('error', 
                                 f"{drive_device} 處理錯誤：{str(e)}")
         finally:
-            self.processing_drives.discard(drive_device)
+            with self._state_lock:
+                self.processing_drives.discard(drive_device)
 
     def _get_drive_path(self, drive_device: str) -> Optional[str]:
         """獲取磁碟機路徑"""
-        for partition in psutil.disk_partitions():
-            if partition.device == drive_device:
-                return partition.mountpoint
-        return None
+        partition = self._get_partition_snapshot()[2].get(drive_device)
+        return partition.mountpoint if partition else None
 
     def _process_drive_workflow(self, drive_device: str, drive_path: str) -> None:
         """執行磁碟機處理工作流程"""
@@ -470,12 +1313,12 @@ class RemovableMediaManager:
         if not self._clear_media_step(drive_device, drive_path):
             return
             
-        # 步驟2：複製檔案
+        # 步驟2：複製檔案（複製時同步驗證寫入完整性）
         filename = self._copy_file_step(drive_device, drive_path)
         if not filename:
             return
             
-        # 步驟3：驗證檔案
+        # 步驟3：讀回目標檔案比對雜湊
         if not self._verify_file_step(drive_device, drive_path, filename):
             return
             
@@ -488,7 +1331,9 @@ class RemovableMediaManager:
                             f"{drive_device} 正在掃描磁碟內容...")
 
         def clear_callback(msg_type, message):
-            self._notify_callback('info', f"{drive_device} {message}")
+            # 合併回報的訊息含多行，每行都加上磁碟機名稱
+            self._notify_callback('info', '\n'.join(
+                f"{drive_device} {line}" for line in message.split('\n')))
 
         success, message = self.clear_drive(drive_path, callback=clear_callback)
         if not success:
@@ -502,8 +1347,10 @@ class RemovableMediaManager:
 
     def _copy_file_step(self, drive_device: str, drive_path: str) -> Optional[str]:
         """執行複製檔案步驟"""
-        filename = os.path.basename(self.source_file)
-        source_size_mb = os.path.getsize(self.source_file) / BYTES_TO_MB
+        if self._source_size_mb is None:
+            self._cache_source_info(self.source_file)
+        filename = self._source_basename or os.path.basename(self.source_file)
+        source_size_mb = self._source_size_mb or 0.0
         
         self._notify_callback('progress', 
                             f"{drive_device} 正在複製檔案：{filename} "
@@ -520,28 +1367,26 @@ class RemovableMediaManager:
                             f"{drive_device} 複製完成：{filename}")
         return filename
 
-    def _verify_file_step(self, drive_device: str, drive_path: str, 
-                         filename: str) -> bool:
-        """執行檔案驗證步驟"""
-        target_path = os.path.join(drive_path, filename)
-        self._notify_callback('progress', 
-                            f"{drive_device} 正在驗證檔案完整性...")
-
-        success, message = self.verify_file(self.source_file, target_path)
+    def _verify_file_step(self, drive_device: str, drive_path: str,
+                          filename: str) -> bool:
+        """執行驗證步驟（讀回目標檔案比對雜湊，源檔案雜湊重複使用快取）"""
+        self._notify_callback('progress', f"{drive_device} 正在驗證檔案...")
+        success, message = self.verify_file(self.source_file, 
+                                            os.path.join(drive_path, filename))
         if not success:
             self._notify_callback('error', 
                                 f"{drive_device} 驗證失敗：{message}")
             return False
 
-        target_size_mb = os.path.getsize(target_path) / BYTES_TO_MB
         self._notify_callback('progress', 
                             f"{drive_device} 驗證成功：檔案大小 "
-                            f"{target_size_mb:.1f} MB，完整性確認")
+                            f"{self._source_size_mb or 0.0:.1f} MB，內容雜湊相符")
         return True
 
     def _complete_processing(self, drive_device: str) -> None:
         """完成處理流程"""
-        self.completed_drives.add(drive_device)
+        with self._state_lock:
+            self.completed_drives.add(drive_device)
         completion_message = (f"{drive_device} 處理完成，"
                             f"請手動執行安全移除（系統托盤→安全移除硬體→{drive_device}）")
         self._notify_callback('complete', completion_message)
@@ -549,7 +1394,7 @@ class RemovableMediaManager:
     def _notify_callback(self, event_type: str, message: str) -> None:
         """通知回調函數處理狀態"""
         if self.callback:
-            self.callback(set(), set(), event_type, message)
+            self.callback(_EMPTY_SET, _EMPTY_SET, event_type, message)
 
     def get_processing_status(self) -> Dict[str, Union[int, List[str]]]:
         """
@@ -558,12 +1403,13 @@ class RemovableMediaManager:
         Returns:
             處理狀態字典
         """
-        return {
-            'processing': len(self.processing_drives),
-            'completed': len(self.completed_drives),
-            'processing_drives': list(self.processing_drives),
-            'completed_drives': list(self.completed_drives)
-        }
+        with self._state_lock:
+            return {
+                'processing': len(self.processing_drives),
+                'completed': len(self.completed_drives),
+                'processing_drives': list(self.processing_drives),
+                'completed_drives': list(self.completed_drives)
+            }
 
 
 class AudioRepeater:
@@ -572,25 +1418,111 @@ class AudioRepeater:
     def __init__(self):
         """初始化音訊重複器"""
         self.supported_formats = SUPPORTED_FORMATS
+        _resolve_ffmpeg()  # 建構時即探測 FFmpeg，生成時直接使用快取結果
+        # 時長快取：(路徑, 修改時間, 檔案大小) → 秒數
+        self._dur_cache: Dict[tuple, float] = {}
 
-    def get_audio_duration(self, file_path: str) -> Optional[float]:
+    def get_audio_duration(self, file_path: str,
+                           st: Optional[os.stat_result] = None) -> Optional[float]:
         """
         獲取音訊檔案的時長（秒）
         
         Args:
             file_path: 音訊檔案路徑
+            st: 呼叫端已取得的檔案狀態（可選，避免重複 stat）
             
         Returns:
             檔案時長（秒），失敗時返回 None
         """
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return None
+
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        duration = self._dur_cache.get(key)
+        if duration is not None:
+            return duration
+
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == '.wav':
+            duration = self._wav_duration_fast(file_path, st.st_size)
+        elif ext == '.mp3':
+            duration = self._mp3_duration_fast(file_path)
+
         try:
-            audio_file = File(file_path)
-            if audio_file is not None and hasattr(audio_file, 'info'):
-                return audio_file.info.length
+            if duration is None:
+                audio_file = self._open_mutagen(file_path)
+                if audio_file is not None and hasattr(audio_file, 'info'):
+                    duration = audio_file.info.length
+        except Exception:
             return None
+
+        if duration is not None:
+            self._dur_cache[key] = duration
+        return duration
+
+    def _mp3_duration_fast(self, file_path: str) -> Optional[float]:
+        """
+        只解析 MP3 音訊框架計算時長（略過 ID3v2 標籤，不載入封面等內容）
+        
+        失敗時返回 None，由呼叫端改用 mutagen 完整解析。
+        """
+        try:
+            from mutagen.mp3 import MPEGInfo
+
+            with open(file_path, 'rb') as f:
+                return MPEGInfo(f, offset=self._id3v2_size(f)).length
         except Exception:
             return None
 
+    def _wav_duration_fast(self, file_path: str, file_size: int) -> Optional[float]:
+        """
+        直接由 WAV 檔頭計算時長（data 區塊長度 / 每秒位元組數）
+        
+        只讀取各區塊標頭與 fmt 區塊，不經 mutagen；格式異常、非標準
+        長度欄位等無法判斷的情況返回 None，由呼叫端改用 mutagen。
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                riff = f.read(12)
+                if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+                    return None
+                byte_rate = 0
+                for _ in range(WAV_MAX_HEADER_CHUNKS):
+                    header = f.read(8)
+                    if len(header) < 8:
+                        return None
+                    chunk_id, chunk_size = header[:4], struct.unpack('<I', header[4:])[0]
+                    if chunk_id == b'fmt ':
+                        fmt = f.read(chunk_size)
+                        if len(fmt) < 16:
+                            return None
+                        byte_rate = struct.unpack('<I', fmt[8:12])[0]
+                        f.seek(chunk_size & 1, os.SEEK_CUR)
+                    elif chunk_id == b'data':
+                        if not byte_rate or chunk_size in (0, WAV_MAX_DATA_SIZE):
+                            return None
+                        data_size = min(chunk_size, file_size - f.tell())
+                        return data_size / byte_rate
+                    else:
+                        f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+        except (OSError, struct.error):
+            pass
+        return None
+
+    def _open_mutagen(self, file_path: str):
+        """依副檔名直接選用解析類別，副檔名不符時才退回格式嗅探"""
+        cls = _mutagen_loaders().get(os.path.splitext(file_path)[1].lower())
+        if cls is not None:
+            try:
+                return cls(file_path)
+            except Exception:
+                pass
+        from mutagen import File
+        return File(file_path)
+
     def calculate_repeat_count(self, audio_duration: float, 
                              target_minutes: float) -> int:
         """
@@ -602,12 +1534,24 @@ class AudioRepeater:
             
         Returns:
             需要重複的次數
+
+        Raises:
+            ValueError: 目標時間不大於 0，或音訊時長不大於 0、不足 1 毫秒時
         """
-        target_seconds = target_minutes * 60
-        return math.ceil(target_seconds / audio_duration)
+        if not target_minutes > 0:
+            raise ValueError("目標時間必須大於 0")
+        if not audio_duration > 0:
+            raise ValueError("音訊時長必須大於 0")
+        duration_ms = int(round(audio_duration * 1000))
+        if duration_ms == 0:
+            raise ValueError("音訊時長過短（不足 1 毫秒），無法計算重複次數")
+        target_ms = max(1, int(round(target_minutes * 60000)))
+        return -(-target_ms // duration_ms)
 
     def create_repeated_audio(self, file_path: str, repeat_count: int,
-                            output_path: str, output_format: str) -> Tuple[bool, str, Optional[str]]:
+                            output_path: str, output_format: str,
+                            progress_callback: Optional[Callable[[float], None]] = None
+                            ) -> Tuple[bool, str, Optional[str]]:
         """
         創建重複音訊檔案
         
@@ -616,131 +1560,288 @@ class AudioRepeater:
             repeat_count: 重複次數
             output_path: 輸出檔案路徑
             output_format: 輸出格式
+            progress_callback: FFmpeg 處理進度回調（參數為百分比，可選）
             
         Returns:
             (成功狀態, 訊息, 實際輸出路徑)
         """
         try:
+            if repeat_count < 1:
+                raise ValueError("重複次數必須至少為 1")
+            self._prefetch_source(file_path)
+            input_ext = _audio_ext(file_path)
+            output_ext = output_format.lower()
+
+            fast_result = self._create_same_format_fast(file_path, repeat_count,
+                                                        output_path, input_ext,
+                                                        output_ext)
+            if fast_result and fast_result[0]:
+                return fast_result
+
             ffmpeg_path = self._find_ffmpeg()
             
             if not ffmpeg_path:
+                if fast_result:
+                    return fast_result
                 return self._handle_no_ffmpeg(file_path, repeat_count, 
-                                            output_path, output_format)
+                                            output_path, input_ext, output_ext)
 
             return self._create_with_ffmpeg(ffmpeg_path, file_path, 
                                           repeat_count, output_path, 
-                                          output_format)
+                                          output_format, progress_callback)
 
         except Exception as e:
             return False, f"錯誤：{str(e)}", None
 
-    def _find_ffmpeg(self) -> Optional[str]:
-        """尋找 FFmpeg 執行檔"""
-        local_ffmpeg = os.path.join(os.getcwd(), FFMPEG_EXE)
+    def _prefetch_source(self, file_path: str) -> None:
+        """
+        提示核心預先讀入來源檔案（POSIX_FADV_WILLNEED，非同步預讀）
+
+        重複處理時來源會被讀取多次（FFmpeg 迴圈讀取或逐份複製），
+        先載入頁面快取後其餘各次皆由記憶體取得；平台不支援時略過。
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _create_same_format_fast(self, file_path: str, repeat_count: int,
+                                 output_path: str, input_ext: str, output_ext: str
+                                 ) -> Optional[Tuple[bool, str, Optional[str]]]:
+        """
+        同格式重複的快速路徑（不經 FFmpeg 解封裝／重新封裝）
         
-        if os.path.exists(local_ffmpeg):
-            return local_ffmpeg
-        elif os.path.exists(FFMPEG_EXE):
-            return FFMPEG_EXE
-        elif shutil.which('ffmpeg'):
-            return 'ffmpeg'
+        僅 WAV 走此路徑；MP3/AAC 直接串接框架會遺失 LAME 標頭的無縫播放
+        資訊，因此只在找不到 FFmpeg 時由 _handle_no_ffmpeg 使用。
         
+        Returns:
+            處理結果；格式不適用時返回 None
+        """
+        if input_ext == output_ext == 'wav':
+            return self._create_repeated_wav_python(file_path, repeat_count, 
+                                                  output_path)
         return None
 
-    def _handle_no_ffmpeg(self, file_path: str, repeat_count: int,
-                         output_path: str, output_format: str) -> Tuple[bool, str, Optional[str]]:
-        """處理沒有 FFmpeg 的情況"""
-        input_ext = os.path.splitext(file_path)[1].lower().lstrip('.')
-        output_ext = output_format.lower()
+    @property
+    def ffmpeg_path(self) -> Optional[str]:
+        """FFmpeg 執行檔路徑（找不到時為 None）"""
+        return _resolve_ffmpeg()
+
+    @property
+    def has_ffmpeg(self) -> bool:
+        """是否可使用 FFmpeg"""
+        return _resolve_ffmpeg() is not None
+
+    def _find_ffmpeg(self) -> Optional[str]:
+        """尋找 FFmpeg 執行檔（使用全程式共用的快取結果）"""
+        return _resolve_ffmpeg()
+
+    def invalidate_ffmpeg_cache(self) -> None:
+        """清除 FFmpeg 路徑快取，下次使用時重新探測"""
+        _resolve_ffmpeg.cache_clear()
 
+    def _handle_no_ffmpeg(self, file_path: str, repeat_count: int,
+                         output_path: str, input_ext: str, 
+                         output_ext: str) -> Tuple[bool, str, Optional[str]]:
+        """處理沒有 FFmpeg 的情況（副檔名已由呼叫端轉為小寫、不含句點）"""
         if input_ext == 'wav' and output_ext == 'wav':
             return self._create_repeated_wav_python(file_path, repeat_count, 
                                                   output_path)
+        elif input_ext == output_ext and input_ext in STREAM_CONCAT_FORMATS:
+            return self._create_repeated_stream_concat(file_path, repeat_count,
+                                                       output_path, input_ext)
         else:
-            error_msg = ("錯誤：找不到 ffmpeg.exe。僅支援 WAV 格式，"
+            error_msg = ("錯誤：找不到 ffmpeg.exe。僅支援 WAV 及同格式 MP3/AAC，"
                         "其他格式需要 ffmpeg 正確處理檔頭")
             return False, error_msg, None
 
     def _create_with_ffmpeg(self, ffmpeg_path: str, file_path: str,
                            repeat_count: int, output_path: str,
-                           output_format: str) -> Tuple[bool, str, Optional[str]]:
-        """使用 FFmpeg 創建重複音訊"""
-        import subprocess
+                           output_format: str,
+                           progress_callback: Optional[Callable[[float], None]] = None
+                           ) -> Tuple[bool, str, Optional[str]]:
+        """
+        使用 FFmpeg 創建重複音訊（檔案列表經由 stdin 傳入，不產生暫存檔）
         
-        temp_dir = os.path.dirname(output_path)
-        list_file = os.path.join(temp_dir, 'filelist.txt')
-
+        可串流複製時以 -stream_loop 重複讀取來源，不需檔案列表；其他情況
+        沿用 concat 列表命令。FFmpeg 以 -progress 逐行回報進度，錯誤輸出
+        只保留最後數行。
+        """
+        input_ext = _audio_ext(file_path)
+        output_ext = output_format.lower()
+        filelist = None
+        if self._can_stream_loop(input_ext, output_ext):
+            cmd = self._build_ffmpeg_loop_command(ffmpeg_path, file_path,
+                                                  repeat_count, output_path,
+                                                  output_ext)
+        else:
+            filelist = self._build_filelist(file_path, repeat_count)
+            cmd = self._build_ffmpeg_command(ffmpeg_path, input_ext, 
+                                           output_path, output_ext)
+
+        total_us = 0
+        if progress_callback:
+            duration = self.get_audio_duration(file_path)
+            total_us = int(duration * repeat_count * 1000000) if duration else 0
+
+        proc = subprocess.Popen(cmd, 
+                                stdin=(subprocess.DEVNULL if filelist is None
+                                       else subprocess.PIPE),
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE)
+        feeder = None
+        if filelist is not None:
+            # 由獨立執行緒寫入檔案列表，避免與讀取 stderr 互相阻塞
+            feeder = threading.Thread(target=self._feed_stdin, 
+                                      args=(proc.stdin, filelist), daemon=True)
+            feeder.start()
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(FFMPEG_TIMEOUT, kill_on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
         try:
-            self._create_filelist(list_file, file_path, repeat_count)
-            cmd = self._build_ffmpeg_command(ffmpeg_path, list_file, 
-                                           file_path, output_path, 
-                                           output_format)
-            
-            result = subprocess.run(cmd, capture_output=True, text=True,
-                                  timeout=FFMPEG_TIMEOUT, encoding='utf-8',
-                                  errors='ignore')
-
-            if result.returncode == 0:
-                return True, f"成功創建檔案：{output_path}", output_path
-            else:
-                return False, f"ffmpeg 錯誤：{result.stderr}", None
-
+            tail = self._read_ffmpeg_progress(proc.stderr, total_us, 
+                                              progress_callback)
+            returncode = proc.wait()
         finally:
-            self._cleanup_temp_file(list_file)
-
-    def _create_filelist(self, list_file: str, file_path: str, 
-                        repeat_count: int) -> None:
-        """創建 FFmpeg 檔案列表"""
-        with open(list_file, 'w', encoding='utf-8') as f:
-            for _ in range(repeat_count):
-                f.write(f"file '{os.path.abspath(file_path)}'\n")
-
-    def _build_ffmpeg_command(self, ffmpeg_path: str, list_file: str,
-                             file_path: str, output_path: str,
-                             output_format: str) -> List[str]:
-        """建立 FFmpeg 命令"""
-        input_ext = os.path.splitext(file_path)[1].lower().lstrip('.')
-        output_ext = output_format.lower()
-
-        base_cmd = [ffmpeg_path, '-y', '-f', 'concat', '-safe', '0',
-                   '-i', list_file]
-
-        format_mapping = {
-            'm4a': 'mp4',
-            'mp4': 'mp4',
-            'mp3': 'mp3',
-            'wav': 'wav',
-            'flac': 'flac',
-            'ogg': 'ogg'
-        }
-
-        input_format = format_mapping.get(input_ext, input_ext)
-        target_format = format_mapping.get(output_ext, output_ext)
-
-        if (input_format == target_format or 
-            (input_ext == 'm4a' and output_ext == 'm4a')):
-            return base_cmd + ['-c', 'copy', output_path]
-        elif output_format.lower() == 'mp3':
-            return base_cmd + ['-c:a', LIBMP3LAME_CODEC, '-b:a', 
-                              DEFAULT_MP3_BITRATE, output_path]
-        elif output_format.lower() == 'wav':
-            return base_cmd + ['-c:a', PCM_S16LE_CODEC, output_path]
+            watchdog.cancel()
+            proc.stderr.close()
+            if feeder is not None:
+                feeder.join(timeout=THREAD_JOIN_TIMEOUT)
+
+        if timed_out.is_set():
+            return False, f"ffmpeg 執行逾時（超過 {FFMPEG_TIMEOUT} 秒）", None
+        if returncode == 0:
+            return True, f"成功創建檔案：{output_path}", output_path
         else:
-            return base_cmd + ['-c', 'copy', output_path]
+            stderr = '\n'.join(tail)
+            return False, f"ffmpeg 錯誤：{stderr}", None
 
-    def _cleanup_temp_file(self, list_file: str) -> None:
-        """清理臨時檔案"""
-        if os.path.exists(list_file):
+    def _feed_stdin(self, stdin, data: bytes) -> None:
+        """寫入資料至子程序 stdin 後關閉（子程序提前結束時忽略錯誤）"""
+        try:
+            stdin.write(data)
+        except (BrokenPipeError, OSError):
+            pass
+        finally:
             try:
-                os.remove(list_file)
+                stdin.close()
             except OSError:
                 pass
 
+    def _read_ffmpeg_progress(self, stderr, total_us: int,
+                              progress_callback: Optional[Callable[[float], None]]
+                              ) -> deque:
+        """
+        逐行讀取 FFmpeg stderr，回報進度並保留最後的錯誤訊息
+        
+        Args:
+            stderr: FFmpeg stderr 管道
+            total_us: 預估輸出總時長（微秒），0 表示未知
+            progress_callback: 進度回調函數（參數為百分比）
+            
+        Returns:
+            最後 FFMPEG_STDERR_TAIL 行非進度輸出（已解碼）
+        """
+        # 以位元組比對進度行，只有保留下來的錯誤訊息才需要解碼
+        tail = deque(maxlen=FFMPEG_STDERR_TAIL)
+        for raw in stderr:
+            line = raw.rstrip()
+            key, sep, value = line.partition(b'=')
+            if not (sep and key.replace(b'_', b'').isalnum()):
+                if line:
+                    tail.append(line)
+                continue
+            # out_time_ms 實際單位為微秒（FFmpeg 歷史命名）
+            if key == b'out_time_ms' and progress_callback and total_us:
+                try:
+                    out_us = int(value)
+                except ValueError:
+                    continue
+                progress_callback(min(100.0, out_us * 100.0 / total_us))
+        return deque((line.decode('utf-8', errors='replace') for line in tail),
+                     maxlen=FFMPEG_STDERR_TAIL)
+
+    def _build_filelist(self, file_path: str, repeat_count: int) -> bytes:
+        """建立 FFmpeg concat 檔案列表內容"""
+        # 列表經由 pipe 讀取，需明確指定 file: 協定，否則路徑會被視為相對於 pipe
+        line = f"file 'file:{os.path.abspath(file_path)}'\n"
+        return (line * repeat_count).encode('utf-8')
+
+    def _can_stream_loop(self, input_ext: str, output_ext: str) -> bool:
+        """判斷是否可用 -stream_loop 直接串流複製（同封裝格式且非原始 ADTS）"""
+        if input_ext in STREAM_LOOP_EXCLUDED:
+            return False
+        return self._ffmpeg_codec_args(input_ext, output_ext) == ['-c', 'copy']
+
+    def _build_ffmpeg_loop_command(self, ffmpeg_path: str, file_path: str,
+                                   repeat_count: int, output_path: str,
+                                   output_ext: str) -> List[str]:
+        """
+        建立以 -stream_loop 重複來源並串流複製的 FFmpeg 命令
+
+        Raises:
+            ValueError: 重複次數小於 1 時（-stream_loop -1 代表無限循環）
+        """
+        if repeat_count < 1:
+            raise ValueError("重複次數必須至少為 1")
+        return (self._ffmpeg_base_args(ffmpeg_path)
+                + ['-stream_loop', str(repeat_count - 1), '-i', file_path,
+                   '-c', 'copy']
+                + self._ffmpeg_muxer_args(output_ext)
+                + [output_path])
+
+    def _build_ffmpeg_command(self, ffmpeg_path: str, input_ext: str, 
+                             output_path: str, output_ext: str) -> List[str]:
+        """建立 FFmpeg 命令"""
+        return (self._ffmpeg_input_args(ffmpeg_path)
+                + self._ffmpeg_codec_args(input_ext, output_ext)
+                + self._ffmpeg_muxer_args(output_ext)
+                + [output_path])
+
+    def _ffmpeg_muxer_args(self, output_ext: str) -> List[str]:
+        """依輸出副檔名取得封裝格式的額外參數"""
+        return list(_MUXER_ARGS.get(FORMAT_MAP.get(output_ext, output_ext), ()))
+
+    def _ffmpeg_base_args(self, ffmpeg_path: str) -> List[str]:
+        """建立共用的 FFmpeg 全域參數（覆寫輸出、只輸出錯誤、進度回報至 stderr）"""
+        return [ffmpeg_path, '-y', '-hide_banner', '-nostats', 
+                '-loglevel', 'error', '-progress', 'pipe:2']
+
+    def _ffmpeg_input_args(self, ffmpeg_path: str) -> List[str]:
+        """建立讀取 stdin concat 列表的 FFmpeg 輸入參數"""
+        return (self._ffmpeg_base_args(ffmpeg_path)
+                + ['-protocol_whitelist', 'pipe,file',
+                   '-f', 'concat', '-safe', '0', '-i', 'pipe:0'])
+
+    def _ffmpeg_codec_args(self, input_ext: str, output_ext: str) -> List[str]:
+        """依輸入與輸出副檔名選擇編碼參數（同格式時直接串流複製）"""
+        if input_ext == output_ext or (input_ext, output_ext) in _STREAMCOPY_PAIRS:
+            return ['-c', 'copy']
+        return list(_TRANSCODE_ARGS.get(output_ext, ('-c', 'copy')))
+
     def _create_repeated_wav_python(self, file_path: str, repeat_count: int,
                                    output_path: str) -> Tuple[bool, str, Optional[str]]:
         """
         使用純 Python 重複 WAV 檔案（正確處理檔頭）
         
+        只處理格式代碼為 PCM 的來源；WAVE_FORMAT_EXTENSIBLE 等其他格式
+        寫成標準 44 位元組檔頭會遺失聲道配置與子格式，返回失敗交由 FFmpeg 處理。
+        資料長度為奇數時依 RIFF 規範補一個填充位元組。
+        
         Args:
             file_path: 輸入檔案路徑
             repeat_count: 重複次數
@@ -750,16 +1851,43 @@ class AudioRepeater:
             (成功狀態, 訊息, 輸出路徑)
         """
         try:
-            import wave
-
-            with wave.open(file_path, 'rb') as input_wav:
+            with open(file_path, 'rb') as src:
+                format_tag = self._wav_format_tag(src)
+                if format_tag != WAVE_FORMAT_PCM:
+                    return False, (f"WAV 處理錯誤：非 PCM 格式（格式代碼 {format_tag}），"
+                                   "需要 ffmpeg 處理"), None
+                src.seek(0)
+                input_wav = wave.open(src)
                 params = input_wav.getparams()
-                frames = input_wav.readframes(params.nframes)
-
-            with wave.open(output_path, 'wb') as output_wav:
-                output_wav.setparams(params)
-                for _ in range(repeat_count):
-                    output_wav.writeframes(frames)
+                # wave 讀完 data 區塊標頭後即停止，此時檔案位置就是 PCM 資料起點
+                data_offset = src.tell()
+                data_len = params.nframes * params.sampwidth * params.nchannels
+                total_len = data_len * repeat_count
+                pad_len = total_len & 1  # RIFF 區塊須對齊偶數位元組
+                if total_len + pad_len > WAV_MAX_DATA_SIZE - (WAV_HEADER.size - 8):
+                    return False, "WAV 處理錯誤：輸出檔案超過 WAV 4GB 上限", None
+
+                # 總長度已知，直接寫出最終檔頭，不需事後回頭修正長度欄位
+                block_align = params.nchannels * params.sampwidth
+                header = WAV_HEADER.pack(
+                    b'RIFF', WAV_HEADER.size - 8 + total_len + pad_len, b'WAVE',
+                    b'fmt ', 16, WAVE_FORMAT_PCM, params.nchannels,
+                    params.framerate, params.framerate * block_align,
+                    block_align, params.sampwidth * 8,
+                    b'data', total_len)
+
+                dst_fd = os.open(output_path, 
+                                 os.O_RDWR | os.O_CREAT | os.O_TRUNC 
+                                 | getattr(os, 'O_BINARY', 0))
+                try:
+                    self._write_fd(dst_fd, header)
+                    self._append_repeated(src.fileno(), dst_fd, data_offset,
+                                          data_len, repeat_count)
+                    if pad_len:
+                        os.lseek(dst_fd, 0, os.SEEK_END)
+                        self._write_fd(dst_fd, b'\0')
+                finally:
+                    os.close(dst_fd)
 
             success_msg = f"成功創建檔案：{output_path}（純 Python WAV 處理）"
             return True, success_msg, output_path
@@ -767,6 +1895,292 @@ class AudioRepeater:
         except Exception as e:
             return False, f"WAV 處理錯誤：{str(e)}", None
 
+    def _wav_format_tag(self, f) -> Optional[int]:
+        """返回 WAV 檔 fmt 區塊的格式代碼（找不到或檔頭異常時為 None）"""
+        f.seek(0)
+        riff = f.read(12)
+        if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+            return None
+        for _ in range(WAV_MAX_HEADER_CHUNKS):
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id, chunk_size = header[:4], struct.unpack('<I', header[4:])[0]
+            if chunk_id == b'fmt ':
+                fmt = f.read(2)
+                return struct.unpack('<H', fmt)[0] if len(fmt) == 2 else None
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+        return None
+
+    def _create_repeated_stream_concat(self, file_path: str, repeat_count: int,
+                                       output_path: str, input_ext: str
+                                       ) -> Tuple[bool, str, Optional[str]]:
+        """
+        直接串接 MP3 / ADTS AAC 音訊框架建立重複檔案（不經解碼，無 FFmpeg 時使用）
+        
+        ID3 標籤只保留一份；MP3 開頭的 Xing/Info/VBRI 標頭框架會被略過，
+        以免播放器依單次長度計算總時長（其中的無縫播放資訊隨之遺失）。
+        標籤之後必須是有效的框架同步字，否則不處理。
+        
+        Args:
+            file_path: 輸入檔案路徑
+            repeat_count: 重複次數
+            output_path: 輸出檔案路徑
+            input_ext: 輸入副檔名（'mp3' 或 'aac'）
+            
+        Returns:
+            (成功狀態, 訊息, 輸出路徑)
+        """
+        try:
+            with open(file_path, 'rb') as src:
+                file_size = os.fstat(src.fileno()).st_size
+                tag_size = self._id3v2_size(src)
+                if not self._has_frame_sync(src, tag_size, input_ext):
+                    return False, "串接處理錯誤：不是有效的 MP3/AAC 音訊框架", None
+                start = tag_size + self._vbr_header_frame_size(src, tag_size)
+                end = file_size - self._id3v1_size(src, file_size)
+                if end <= start:
+                    return False, "串接處理錯誤：找不到音訊資料", None
+
+                src.seek(0)
+                id3v2_tag = src.read(tag_size)
+                src.seek(end)
+                id3v1_tag = src.read()
+
+                dst_fd = os.open(output_path, 
+                                 os.O_RDWR | os.O_CREAT | os.O_TRUNC 
+                                 | getattr(os, 'O_BINARY', 0))
+                try:
+                    self._write_fd(dst_fd, id3v2_tag)
+                    self._append_repeated(src.fileno(), dst_fd, start,
+                                          end - start, repeat_count)
+                    self._write_fd(dst_fd, id3v1_tag)
+                finally:
+                    os.close(dst_fd)
+
+            success_msg = f"成功創建檔案：{output_path}（直接串接音訊框架）"
+            return True, success_msg, output_path
+
+        except Exception as e:
+            return False, f"串接處理錯誤：{str(e)}", None
+
+    def _id3v2_size(self, f) -> int:
+        """返回檔案開頭 ID3v2 標籤的總長度（沒有標籤時為 0）"""
+        f.seek(0)
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != b'ID3':
+            return 0
+        size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+        footer_size = 10 if header[5] & 0x10 else 0
+        return 10 + size + footer_size
+
+    def _has_frame_sync(self, f, offset: int, input_ext: str) -> bool:
+        """檢查指定位置是否為 MP3 Layer III 框架或 ADTS AAC 框架的開頭"""
+        f.seek(offset)
+        header = f.read(4)
+        if len(header) < 4 or header[0] != 0xFF:
+            return False
+        if input_ext == 'aac':
+            return (header[1] & 0xF6) == 0xF0  # ADTS：同步字 12 位元、layer 為 0
+        version = (header[1] >> 3) & 0x03
+        return ((header[1] & 0xE0) == 0xE0 and version in MP3_SAMPLE_RATES
+                and (header[1] >> 1) & 0x03 == 1 and header[2] >> 4 not in (0, 15)
+                and (header[2] >> 2) & 0x03 != 3)
+
+    def _id3v1_size(self, f, file_size: int) -> int:
+        """返回檔案結尾 ID3v1 標籤的長度（沒有標籤時為 0）"""
+        if file_size < ID3V1_TAG_SIZE:
+            return 0
+        f.seek(file_size - ID3V1_TAG_SIZE)
+        return ID3V1_TAG_SIZE if f.read(3) == b'TAG' else 0
+
+    def _vbr_header_frame_size(self, f, offset: int) -> int:
+        """若指定位置是 MP3 的 Xing/Info/VBRI 標頭框架，返回其長度，否則返回 0"""
+        f.seek(offset)
+        frame = f.read(44)
+        if len(frame) < 44 or frame[0] != 0xFF or (frame[1] & 0xE0) != 0xE0:
+            return 0
+
+        version = (frame[1] >> 3) & 0x03
+        layer = (frame[1] >> 1) & 0x03
+        bitrate_index = frame[2] >> 4
+        rate_index = (frame[2] >> 2) & 0x03
+        if (layer != 1 or version not in MP3_SAMPLE_RATES 
+                or bitrate_index in (0, 15) or rate_index == 3):
+            return 0
+        if not any(tag in frame[4:] for tag in MP3_VBR_TAGS):
+            return 0
+
+        is_mpeg1 = version == 3
+        bitrates = MP3_BITRATES_V1 if is_mpeg1 else MP3_BITRATES_V2
+        bitrate = bitrates[bitrate_index] * 1000
+        sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+        padding = (frame[2] >> 1) & 0x01
+        return (144 if is_mpeg1 else 72) * bitrate // sample_rate + padding
+
+    def _append_repeated(self, src_fd: int, dst_fd: int, offset: int,
+                         length: int, repeat_count: int) -> None:
+        """
+        將來源檔案的指定區段重複寫入目標檔案目前位置
+        
+        區段較小時只讀取一次，以 bytes 乘法組成約 COPY_RANGE_CHUNK 大小的
+        區塊整批寫入，寫入次數由 repeat_count 降為總長度 / 區塊大小；
+        支援 os.pwrite 時先配置檔案長度，再由多個執行緒寫入互不重疊的位置。
+        區段較大時先寫入一份，再以 _double_in_place 在目標檔案內倍增，
+        不支援時逐次以 _append_file_range 於核心內複製。
+        
+        Args:
+            src_fd: 來源檔案描述符
+            dst_fd: 目標檔案描述符
+            offset: 來源區段起點
+            length: 區段長度
+            repeat_count: 重複次數
+        """
+        per_block = COPY_RANGE_CHUNK // length if length else 0
+        if per_block < 2:
+            start = os.lseek(dst_fd, 0, os.SEEK_CUR)
+            self._append_file_range(src_fd, dst_fd, offset, length)
+            done = self._double_in_place(dst_fd, start, length, repeat_count)
+            for _ in range(repeat_count - done):
+                self._append_file_range(src_fd, dst_fd, offset, length)
+            return
+
+        data = self._read_at(src_fd, offset, length)
+        if len(data) != length:
+            raise EOFError("來源資料長度不足")
+        full_blocks, remainder = divmod(repeat_count, per_block)
+        block = data * per_block if full_blocks else b''
+        if full_blocks > 1 and hasattr(os, 'pwrite'):
+            start = os.lseek(dst_fd, 0, os.SEEK_CUR)
+            end = start + length * repeat_count
+            os.ftruncate(dst_fd, end)
+            max_workers = min(MAX_WRITE_WORKERS, full_blocks)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._pwrite_fd, dst_fd, block,
+                                    start + i * len(block))
+                    for i in range(full_blocks)
+                ]
+                for future in futures:
+                    future.result()
+            os.lseek(dst_fd, start + full_blocks * len(block), os.SEEK_SET)
+        else:
+            for _ in range(full_blocks):
+                self._write_fd(dst_fd, block)
+        if remainder:
+            self._write_fd(dst_fd, data * remainder)
+
+    def _double_in_place(self, dst_fd: int, start: int, length: int,
+                         repeat_count: int) -> int:
+        """
+        以 os.copy_file_range 複製目標檔案中已寫入的部分，使份數逐次倍增
+        
+        呼叫次數由 repeat_count 降為 log2(repeat_count)；支援區塊共用的
+        檔案系統（btrfs、XFS）只需更新中繼資料。
+        
+        Args:
+            dst_fd: 目標檔案描述符（已寫入第一份）
+            start: 第一份在目標檔案中的起點
+            length: 每份長度
+            repeat_count: 目標份數
+            
+        Returns:
+            已完整寫入的份數；檔案位置移至其後，由呼叫端接續其餘份數
+        """
+        done = 1
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while done < repeat_count:
+                    count = min(done, repeat_count - done) * length
+                    dst_offset = start + done * length
+                    copied = 0
+                    try:
+                        while copied < count:
+                            n = os.copy_file_range(dst_fd, dst_fd, count - copied,
+                                                   start + copied,
+                                                   dst_offset + copied)
+                            if n == 0:
+                                break
+                            copied += n
+                    finally:
+                        done += copied // length
+                    if copied < count:
+                        break
+            except OSError as e:
+                if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL,
+                                   errno.EOPNOTSUPP, errno.EPERM, errno.EBADF):
+                    raise
+        os.lseek(dst_fd, start + done * length, os.SEEK_SET)
+        return done
+
+    def _append_file_range(self, src_fd: int, dst_fd: int, 
+                           offset: int, length: int) -> None:
+        """
+        將來源檔案的指定區段寫入目標檔案目前位置
+        
+        優先使用 os.copy_file_range（Linux，可共用區塊的檔案系統上不需實際
+        複製資料），其次為 os.sendfile 在核心內複製；平台不支援時改以固定
+        大小區塊串流，記憶體用量與檔案大小無關。
+        
+        Args:
+            src_fd: 來源檔案描述符
+            dst_fd: 目標檔案描述符
+            offset: 來源區段起點
+            length: 區段長度
+        """
+        done = 0
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while done < length:
+                    n = os.copy_file_range(src_fd, dst_fd, length - done,
+                                           offset + done)
+                    if n == 0:
+                        break
+                    done += n
+            except OSError as e:
+                if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL,
+                                   errno.EOPNOTSUPP, errno.EPERM, errno.EBADF):
+                    raise
+
+        if hasattr(os, 'sendfile') and done < length:
+            try:
+                while done < length:
+                    sent = os.sendfile(dst_fd, src_fd, offset + done, length - done)
+                    if sent == 0:
+                        break
+                    done += sent
+            except OSError:
+                pass  # 目標不支援 sendfile（如 macOS），改用一般讀寫
+
+        while done < length:
+            chunk = self._read_at(src_fd, offset + done,
+                                  min(COPY_CHUNK_SIZE, length - done))
+            if not chunk:
+                raise EOFError("來源資料長度不足")
+            self._write_fd(dst_fd, chunk)
+            done += len(chunk)
+
+    def _write_fd(self, fd: int, data: bytes) -> None:
+        """完整寫入資料到檔案描述符（處理部分寫入）"""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def _pwrite_fd(self, fd: int, data: bytes, offset: int) -> None:
+        """完整寫入資料到檔案的指定位置（不影響檔案目前位置）"""
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            view = view[written:]
+            offset += written
+
+    def _read_at(self, fd: int, offset: int, size: int) -> bytes:
+        """從指定位置讀取資料（Windows 無 os.pread 時改用 lseek + read）"""
+        if hasattr(os, 'pread'):
+            return os.pread(fd, size, offset)
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+
 
 class AudioRepeaterGUI:
     """音訊重複器 GUI 管理器"""
@@ -777,6 +2191,36 @@ class AudioRepeaterGUI:
         self.window = self._create_window()
         self.media_manager = None
         self.current_drives = []
+        self._progress_step = -1  # 最近一次顯示的生成進度（10% 為一級）
+        self._batch_status_dirty = False  # 批次狀態需於本幀結束時更新
+        self._last_refresh = 0.0          # 上次更新批次狀態的時間（monotonic）
+        self._pending_output: List[str] = []  # 本幀待輸出的媒體／批次訊息
+        self._media_list_dirty = False        # 媒體列表需於本幀結束時更新
+        self._log_ring = deque(maxlen=OUTPUT_MAX_LINES)  # 輸出區各行內容（只保留最新）
+        self._log_since_trim = 0              # 上次裁切後新增的訊息數
+        # 單一背景執行緒讀取音訊時長，避免阻塞 GUI
+        self._dur_executor = ThreadPoolExecutor(max_workers=1, 
+                                                thread_name_prefix='dur')
+        # 單一背景執行緒執行手動複製，依序處理且不阻塞 GUI
+        self._copy_executor = ThreadPoolExecutor(max_workers=1, 
+                                                 thread_name_prefix='copy')
+        self._copy_step = -1  # 最近一次回報的複製進度（10% 為一級）
+        self._last_target: Tuple[Optional[str], float] = (None, 0.0)  # 上次解析的目標時間
+        # 上次計算結果：(檔案路徑, 目標時間字串, 重複次數)，生成時輸入未變即直接沿用
+        self._last_calc: Tuple[Optional[str], Optional[str], int] = (None, None, 0)
+        # 上次組成的輸出路徑：((輸出資料夾, 檔名, 格式), 完整路徑)
+        self._last_output: Tuple[Optional[tuple], str] = (None, '')
+        # 單一背景執行緒執行音訊生成（FFmpeg 編碼期間 GUI 仍可回應）
+        self._gen_executor = ThreadPoolExecutor(max_workers=1, 
+                                                thread_name_prefix='gen')
+        self._generating = False  # 是否有生成工作進行中
+        self._drive_gen = 0       # 磁碟機變化世代（GUI 執行緒於插拔、清空或複製完成時遞增）
+        self._cached_gen = -1     # 媒體列表最後一次重建時的世代
+        # 媒體選項文字快取：(設備, 可用 MiB, 總 MiB) → 顯示文字
+        self._option_cache: Dict[Tuple[str, int, int], str] = {}
+        self._media_by_label: Dict[str, Dict] = {}  # 選項顯示文字 → 磁碟機資訊
+        self._last_drive_options: Optional[List[str]] = None  # 上次顯示的選項
+        self._event_handlers = self._build_event_handlers()
 
     def _create_window(self) -> sg.Window:
         """創建主視窗"""
@@ -833,7 +2277,7 @@ class AudioRepeaterGUI:
              sg.Text('--', key='-REPEAT_COUNT-', size=(10, 1))],
             
             [sg.Text('輸出格式:', size=(LABEL_WIDTH, 1)),
-             sg.Combo(['mp3', 'wav', 'm4a', 'flac', 'ogg'], 
+             sg.Combo(list(OUTPUT_FORMATS), 
                      default_value='mp3', key='-OUTPUT_FORMAT-', 
                      size=(10, 1), enable_events=True)],
             
@@ -941,8 +2385,8 @@ class AudioRepeaterGUI:
         )
         self.media_manager.start_monitoring()
 
-    def _media_change_callback(self, new_drives: Set[str], 
-                              removed_drives: Set[str], 
+    def _media_change_callback(self, new_drives: AbstractSet[str], 
+                              removed_drives: AbstractSet[str], 
                               event_type: Optional[str] = None, 
                               message: Optional[str] = None) -> None:
         """媒體變化回調函數"""
@@ -955,8 +2399,8 @@ class AudioRepeaterGUI:
         except Exception:
             pass
 
-    def _handle_drive_changes(self, new_drives: Set[str], 
-                             removed_drives: Set[str]) -> None:
+    def _handle_drive_changes(self, new_drives: AbstractSet[str], 
+                             removed_drives: AbstractSet[str]) -> None:
         """處理磁碟機變化"""
         for drive in new_drives:
             self.window.write_event_value('-MEDIA_CHANGED-', f'插入: {drive}')
@@ -965,12 +2409,13 @@ class AudioRepeaterGUI:
 
     def _check_ffmpeg_status(self) -> None:
         """檢查 FFmpeg 狀態"""
-        if os.path.exists(FFMPEG_EXE):
-            self.window['-FFMPEG_STATUS-'].update(
-                '本地 ffmpeg.exe - 支援所有格式', text_color='green')
-        elif shutil.which('ffmpeg'):
+        ffmpeg_path = self.repeater.ffmpeg_path
+        if ffmpeg_path == 'ffmpeg':
             self.window['-FFMPEG_STATUS-'].update(
                 '系統 PATH 中的 ffmpeg - 支援所有格式', text_color='orange')
+        elif ffmpeg_path:
+            self.window['-FFMPEG_STATUS-'].update(
+                '本地 ffmpeg.exe - 支援所有格式', text_color='green')
         else:
             self.window['-FFMPEG_STATUS-'].update(
                 '未找到 ffmpeg - 僅支援 WAV 格式', text_color='red')
@@ -979,38 +2424,68 @@ class AudioRepeaterGUI:
         """初始化輸出目錄"""
         self.window['-OUTPUT_DIR-'].update(os.getcwd())
 
-    def _update_media_list(self, preserve_selection: bool = False) -> List[Dict]:
-        """更新媒體列表"""
+    def _update_media_list(self, preserve_selection: bool = False,
+                           force: bool = False) -> List[Dict]:
+        """
+        更新媒體列表
+        
+        Args:
+            preserve_selection: 是否保留目前選擇
+            force: 是否忽略快取強制重新列舉（例如使用者按下重新整理）
+            
+        Returns:
+            可移動磁碟機資訊列表
+        """
+        drive_gen = self._drive_gen
+        if not force and drive_gen == self._cached_gen:
+            return self.current_drives  # 磁碟機未變化，沿用上次結果
+
         current_selection = (self.window['-MEDIA_LIST-'].get() 
                            if preserve_selection else None)
+        selected_drive = self._media_by_label.get(current_selection)
 
         drives = self.media_manager.get_removable_drives()
         drive_options = []
+        option_cache = {}
+        option_by_device = {}
+        media_by_label = {}
         
         for drive in drives:
-            size_gb = drive['total'] / BYTES_TO_GB
-            free_gb = drive['free'] / BYTES_TO_GB
-            option = (f"{drive['device']} "
-                     f"({free_gb:.1f}GB free / {size_gb:.1f}GB total)")
+            key = (drive['device'], drive['free'] >> 20, drive['total'] >> 20)
+            option = self._option_cache.get(key)
+            if option is None:
+                option = _DRIVE_FMT({'device': drive['device'],
+                                     'free': drive['free'] / BYTES_TO_GB,
+                                     'total': drive['total'] / BYTES_TO_GB})
+            option_cache[key] = option
+            option_by_device[drive['device']] = option
+            media_by_label[option] = drive
             drive_options.append(option)
 
+        self._option_cache = option_cache  # 只保留目前存在的媒體
+        self.current_drives = drives
+        self._media_by_label = media_by_label
+        self._cached_gen = drive_gen
+
+        if drive_options == self._last_drive_options:
+            return drives  # 顯示內容未變，不重設下拉選單（避免重繪與失去選擇）
+        self._last_drive_options = drive_options
+
         self.window['-MEDIA_LIST-'].update(values=drive_options)
 
-        if preserve_selection and current_selection:
-            self._restore_media_selection(current_selection, drive_options)
+        if preserve_selection and selected_drive:
+            self._restore_media_selection(selected_drive['device'], 
+                                          option_by_device)
 
         self._update_media_status(drives)
-        self.current_drives = drives
         return drives
 
-    def _restore_media_selection(self, current_selection: str, 
-                                drive_options: List[str]) -> None:
-        """恢復媒體選擇"""
-        current_device = current_selection.split(' ')[0]
-        for option in drive_options:
-            if option.startswith(current_device):
-                self.window['-MEDIA_LIST-'].update(value=option)
-                break
+    def _restore_media_selection(self, current_device: str, 
+                                option_by_device: Dict[str, str]) -> None:
+        """恢復媒體選擇（依設備名稱找出新的選項文字）"""
+        option = option_by_device.get(current_device)
+        if option:
+            self.window['-MEDIA_LIST-'].update(value=option)
 
     def _update_media_status(self, drives: List[Dict]) -> None:
         """更新媒體狀態顯示"""
@@ -1022,59 +2497,166 @@ class AudioRepeaterGUI:
                                                text_color='gray')
 
     def _get_selected_media_path(self) -> Optional[str]:
-        """獲取選中媒體的實際路徑"""
-        selected = self.window['-MEDIA_LIST-'].get()
-        if not selected:
-            return None
-
-        device = selected.split(' ')[0]
-        for drive in self.current_drives:
-            if drive['device'] == device:
-                return drive['mountpoint']
-        return None
+        """獲取選中媒體的實際路徑（由選項文字直接查表，不解析字串）"""
+        drive = self._media_by_label.get(self.window['-MEDIA_LIST-'].get())
+        return drive['mountpoint'] if drive else None
 
-    def _copy_to_media(self, file_path: str) -> bool:
-        """複製檔案到媒體"""
+    def _copy_to_media(self, file_path: str, auto: bool = False) -> bool:
+        """
+        複製檔案到媒體（清空與複製於背景執行緒進行）
+        
+        Args:
+            file_path: 要複製的檔案路徑
+            auto: 是否為生成後的自動複製
+            
+        Returns:
+            是否已開始複製
+        """
         media_path = self._get_selected_media_path()
         if not media_path:
-            self.window['-OUTPUT-'].print('錯誤: 請選擇一個媒體裝置')
+            self._log('錯誤: 請選擇一個媒體裝置')
             return False
 
-        if not os.path.exists(file_path):
-            self.window['-OUTPUT-'].print('錯誤: 檔案不存在')
-            return False
-
-        if self.window['-CLEAR_BEFORE_COPY-'].get():
-            self.window['-OUTPUT-'].print(f'正在清空媒體 {media_path}...')
-            success, message = self.media_manager.clear_drive(media_path)
-            self.window['-OUTPUT-'].print(message)
-            if not success:
-                return False
+        # 呼叫端已確認檔案存在；複製時若檔案消失，背景複製會回報錯誤
+        clear_first = self.window['-CLEAR_BEFORE_COPY-'].get()
+        self._copy_executor.submit(self._copy_to_media_worker, file_path, 
+                                   media_path, clear_first, auto)
+        return True
 
-        filename = os.path.basename(file_path)
-        self.window['-OUTPUT-'].print(f'正在複製檔案到媒體 {media_path}...')
-        success, message = self.media_manager.copy_file_to_drive(
-            file_path, media_path, filename)
-        self.window['-OUTPUT-'].print(message)
+    def _copy_to_media_worker(self, file_path: str, media_path: str, 
+                              clear_first: bool, auto: bool) -> None:
+        """背景清空並複製檔案，進度與結果經由事件回傳 GUI"""
+        post = self.window.write_event_value
+        success = False
+        try:
+            if clear_first:
+                post('-COPY_STATUS-', f'正在清空媒體 {media_path}...')
+                success, message = self.media_manager.clear_drive(media_path)
+                post('-COPY_STATUS-', message)
+                if not success:
+                    return
+
+            self._copy_step = -1
+            filename = os.path.basename(file_path)
+            post('-COPY_STATUS-', f'正在複製檔案到媒體 {media_path}...')
+            success, message = self.media_manager.copy_file_to_drive(
+                file_path, media_path, filename, 
+                progress_callback=self._post_copy_progress)
+            post('-COPY_STATUS-', message)
+        except Exception as e:
+            success = False
+            post('-COPY_STATUS-', f'錯誤: {str(e)}')
+        finally:
+            post('-COPY_DONE-', (success, auto))
 
-        return success
+    def _post_copy_progress(self, copied: int, total: int) -> None:
+        """回報複製進度（每 10% 送出一次事件）"""
+        if total <= 0:
+            return
+        step = copied * 10 // total
+        if step > self._copy_step:
+            self._copy_step = step
+            self.window.write_event_value('-COPY_PROGRESS-', step * 10)
+
+    def _handle_copy_status(self, values: Dict) -> None:
+        """顯示背景複製訊息"""
+        self._log(values['-COPY_STATUS-'])
+
+    def _handle_copy_progress(self, values: Dict) -> None:
+        """顯示背景複製進度"""
+        self._log(f"複製進度: {values['-COPY_PROGRESS-']}%")
+
+    def _handle_copy_done(self, values: Dict) -> None:
+        """處理背景複製完成事件"""
+        success, auto = values['-COPY_DONE-']
+        self._invalidate_media_list()  # 可用空間已改變
+        if auto:
+            if success:
+                self._log('自動複製完成！')
+            else:
+                self._log('自動複製失敗，可手動複製')
 
     def _run_event_loop(self) -> None:
-        """運行事件循環"""
+        """
+        運行事件循環
+        
+        每幀先取出所有已排隊的事件（含背景執行緒透過 write_event_value
+        送入的事件），再統一更新一次狀態顯示。仍有待輸出的訊息或待更新的
+        狀態時以 EVENT_POLL_TIMEOUT 為幀間隔，否則阻塞等待下一個事件，
+        閒置時不佔用 CPU。
+        """
         while True:
-            event, values = self.window.read()
+            timeout = EVENT_POLL_TIMEOUT if self._has_pending_frame_work() else None
+            event, values = self.window.read(timeout=timeout)
 
-            if event in (sg.WIN_CLOSED, '退出'):
-                break
+            while event != sg.TIMEOUT_KEY:
+                if event in (sg.WIN_CLOSED, '退出'):
+                    return
 
-            try:
-                self._handle_event(event, values)
-            except Exception as e:
-                self.window['-OUTPUT-'].print(f'錯誤: {str(e)}')
+                if event not in COALESCED_EVENTS:
+                    self._flush_pending_output()  # 維持訊息輸出順序
 
-    def _handle_event(self, event: str, values: Dict) -> None:
-        """處理事件"""
-        event_handlers = {
+                try:
+                    self._handle_event(event, values)
+                except Exception as e:
+                    self._log(f'錯誤: {str(e)}')
+
+                event, values = self.window.read(timeout=0)
+
+            self._end_frame()
+
+    def _log(self, message: str) -> None:
+        """
+        輸出訊息至輸出區（保留最新 OUTPUT_MAX_LINES 行）
+
+        多行訊息逐行計入上限；未達上限時直接附加，達上限後每新增
+        OUTPUT_TRIM_EVERY 行以緩衝區內容重繪一次，避免文字元件無限增長
+        拖慢每次輸出。
+        """
+        ring = self._log_ring
+        lines = message.split('\n')
+        if len(ring) + len(lines) <= ring.maxlen:
+            ring.extend(lines)
+            self.window['-OUTPUT-'].print(message)
+            return
+
+        ring.extend(lines)
+        self._log_since_trim += len(lines)
+        if self._log_since_trim >= OUTPUT_TRIM_EVERY:
+            self._log_since_trim = 0
+            self.window['-OUTPUT-'].update(value='\n'.join(ring) + '\n')
+        else:
+            self.window['-OUTPUT-'].print(message)
+
+    def _flush_pending_output(self) -> None:
+        """將累積的訊息一次輸出"""
+        if self._pending_output:
+            self._log('\n'.join(self._pending_output))
+            self._pending_output.clear()
+
+    def _has_pending_frame_work(self) -> bool:
+        """是否仍有需於下一幀處理的輸出、媒體列表或批次狀態更新"""
+        return bool(self._pending_output or self._media_list_dirty 
+                    or self._batch_status_dirty)
+
+    def _end_frame(self) -> None:
+        """幀結束時輸出累積訊息，並更新媒體列表與批次狀態（每幀最多一次）"""
+        self._flush_pending_output()
+        if self._media_list_dirty:
+            self._media_list_dirty = False
+            self._update_media_list(preserve_selection=True)
+        if not self._batch_status_dirty:
+            return
+        now = time.monotonic()
+        if now - self._last_refresh < EVENT_POLL_TIMEOUT / 1000:
+            return
+        self._batch_status_dirty = False
+        self._last_refresh = now
+        self._update_batch_status()
+
+    def _build_event_handlers(self) -> Dict[str, Callable[[Dict], None]]:
+        """建立事件處理函數對照表（初始化時建立一次）"""
+        return {
             '-MEDIA_CHANGED-': self._handle_media_changed,
             '-BATCH_UPDATE-': self._handle_batch_update,
             '-BATCH_FILE-': self._handle_batch_file,
@@ -1086,39 +2668,45 @@ class AudioRepeaterGUI:
             '複製到媒體': self._handle_copy_to_media,
             '-OUTPUT_FORMAT-': self._handle_output_format,
             '-FILE-': self._handle_file_selection,
+            '-DURATION_DONE-': self._handle_duration_done,
+            '-COPY_STATUS-': self._handle_copy_status,
+            '-COPY_PROGRESS-': self._handle_copy_progress,
+            '-COPY_DONE-': self._handle_copy_done,
+            '-GEN_PROGRESS-': self._handle_gen_progress,
+            '-GEN_DONE-': self._handle_gen_done,
             '計算重複次數': self._handle_calculate_repeat,
             '生成檔案': self._handle_generate_file,
             '聯絡資訊': self._handle_contact_info,
         }
 
-        handler = event_handlers.get(event)
+    def _handle_event(self, event: str, values: Dict) -> None:
+        """處理事件"""
+        handler = self._event_handlers.get(event)
         if handler:
             handler(values)
 
     def _handle_media_changed(self, values: Dict) -> None:
         """處理媒體變化事件"""
         message = values['-MEDIA_CHANGED-']
-        self.window['-OUTPUT-'].print(f'媒體變化: {message}')
-        self._update_media_list(preserve_selection=True)
+        self._pending_output.append(f'媒體變化: {message}')
+        self._invalidate_media_list()
+
+    def _invalidate_media_list(self) -> None:
+        """使媒體列表快取失效，於本幀結束時重新列舉（只在 GUI 執行緒呼叫）"""
+        self._drive_gen += 1
+        self._media_list_dirty = True
 
     def _handle_batch_update(self, values: Dict) -> None:
         """處理批次更新事件"""
         update_info = values['-BATCH_UPDATE-']
         event_type, message = update_info.split(':', 1)
 
-        emoji_map = {
-            'start': '🔄',
-            'progress': '⏳',
-            'info': '📋',
-            'warning': '⚠️',
-            'complete': '✅',
-            'error': '❌'
-        }
+        emoji = EMOJI_MAP.get(event_type, '')
+        self._pending_output.append(f'{emoji} {message}')
+        if event_type == 'complete':
+            self._invalidate_media_list()  # 批次複製完成，可用空間已改變
 
-        emoji = emoji_map.get(event_type, '')
-        self.window['-OUTPUT-'].print(f'{emoji} {message}')
-
-        self._update_batch_status()
+        self._batch_status_dirty = True
 
     def _update_batch_status(self) -> None:
         """更新批次狀態"""
@@ -1140,9 +2728,9 @@ class AudioRepeaterGUI:
     def _handle_batch_file(self, values: Dict) -> None:
         """處理批次檔案選擇"""
         batch_file = values['-BATCH_FILE-']
-        if batch_file and os.path.exists(batch_file):
+        if batch_file and self._stat_file(batch_file):
             filename = os.path.basename(batch_file)
-            self.window['-OUTPUT-'].print(f'📁 已選擇批次處理檔案: {filename}')
+            self._log(f'📁 已選擇批次處理檔案: {filename}')
             
             if values['-BATCH_MODE-']:
                 self.media_manager.set_batch_mode(True, batch_file)
@@ -1155,21 +2743,23 @@ class AudioRepeaterGUI:
 
         if batch_mode:
             batch_file = values['-BATCH_FILE-']
-            if batch_file and os.path.exists(batch_file):
+            if batch_file and self._stat_file(batch_file) is not None:
                 self.media_manager.set_batch_mode(True, batch_file)
                 self.window['-BATCH_STATUS-'].update('等待媒體插入...', 
                                                    text_color='blue')
-                self.window['-OUTPUT-'].print('🚀 批次處理模式已啟用')
                 filename = os.path.basename(batch_file)
-                self.window['-OUTPUT-'].print(f'📁 處理檔案: {filename}')
-                self.window['-OUTPUT-'].print('💡 插入媒體將自動執行：清空→複製→驗證→完成通知')
+                self._log('\n'.join([
+                    '🚀 批次處理模式已啟用',
+                    f'📁 處理檔案: {filename}',
+                    '💡 插入媒體將自動執行：清空→複製→驗證→完成通知',
+                ]))
             else:
                 self.window['-BATCH_MODE-'].update(False)
-                self.window['-OUTPUT-'].print('❌ 請先選擇要處理的檔案')
+                self._log('❌ 請先選擇要處理的檔案')
         else:
             self.media_manager.set_batch_mode(False)
             self.window['-BATCH_STATUS-'].update('未啟用', text_color='gray')
-            self.window['-OUTPUT-'].print('⏹️ 批次處理模式已關閉')
+            self._log('⏹️ 批次處理模式已關閉')
 
     def _handle_toggle_manual(self, values: Dict) -> None:
         """處理手動區域切換"""
@@ -1180,18 +2770,21 @@ class AudioRepeaterGUI:
             self.window['-TOGGLE_MANUAL-'].update('▶ 手動媒體操作')
         else:
             self.window['-TOGGLE_MANUAL-'].update('▼ 手動媒體操作')
-            self._update_media_list(preserve_selection=True)
+            self._invalidate_media_list()  # 展開時重新列舉，顯示最新可用空間
 
     def _handle_refresh_media(self, values: Dict) -> None:
-        """處理重新整理媒體"""
-        self._update_media_list(preserve_selection=True)
-        self.window['-OUTPUT-'].print('媒體列表已更新')
+        """處理重新整理媒體（同時重新檢查 FFmpeg，以便偵測執行中安裝）"""
+        self._update_media_list(preserve_selection=True, force=True)
+        self.repeater.invalidate_ffmpeg_cache()
+        self._check_ffmpeg_status()
+        self._log('媒體列表已更新')
 
     def _handle_media_selection(self, values: Dict) -> None:
         """處理媒體選擇變化"""
         selected = values['-MEDIA_LIST-']
         if selected:
-            device = selected.split(' ')[0]
+            drive = self._media_by_label.get(selected)
+            device = drive['device'] if drive else selected
             self.window['-MEDIA_STATUS-'].update(f'已選擇: {device}', 
                                                text_color='blue')
         else:
@@ -1202,35 +2795,43 @@ class AudioRepeaterGUI:
         """處理清空媒體"""
         media_path = self._get_selected_media_path()
         if media_path:
-            self.window['-OUTPUT-'].print(f'正在清空媒體 {media_path}...')
+            self._log(f'正在清空媒體 {media_path}...')
             success, message = self.media_manager.clear_drive(media_path)
-            self.window['-OUTPUT-'].print(message)
+            self._log(message)
+            self._invalidate_media_list()
         else:
-            self.window['-OUTPUT-'].print('錯誤: 請先選擇一個媒體裝置')
+            self._log('錯誤: 請先選擇一個媒體裝置')
 
     def _handle_copy_to_media(self, values: Dict) -> None:
         """處理複製到媒體"""
         manual_file = values['-MANUAL_FILE-']
 
-        if manual_file and os.path.exists(manual_file):
+        if manual_file and self._stat_file(manual_file):
             self._copy_to_media(manual_file)
         else:
             self._copy_generated_file(values)
 
     def _copy_generated_file(self, values: Dict) -> None:
         """複製生成的檔案"""
-        output_dir = values['-OUTPUT_DIR-']
-        output_name = values['-OUTPUT_NAME-']
-        output_format = values['-OUTPUT_FORMAT-']
-
-        if output_name and output_format:
-            output_file = os.path.join(output_dir, f"{output_name}.{output_format}")
-            if os.path.exists(output_file):
+        if values['-OUTPUT_NAME-'] and values['-OUTPUT_FORMAT-']:
+            output_file = self._compose_output_path(values)
+            if self._stat_file(output_file):
                 self._copy_to_media(output_file)
             else:
-                self.window['-OUTPUT-'].print('錯誤: 請選擇要複製的檔案或先生成檔案')
+                self._log('錯誤: 請選擇要複製的檔案或先生成檔案')
         else:
-            self.window['-OUTPUT-'].print('錯誤: 請選擇要複製的檔案')
+            self._log('錯誤: 請選擇要複製的檔案')
+
+    def _compose_output_path(self, values: Dict) -> str:
+        """組成輸出檔案完整路徑，資料夾、檔名與格式未變時沿用上次結果"""
+        key = (values['-OUTPUT_DIR-'], values['-OUTPUT_NAME-'], 
+               values['-OUTPUT_FORMAT-'])
+        if key == self._last_output[0]:
+            return self._last_output[1]
+        output_dir, output_name, output_format = key
+        output_file = os.path.join(output_dir, f"{output_name}.{output_format}")
+        self._last_output = (key, output_file)
+        return output_file
 
     def _handle_output_format(self, values: Dict) -> None:
         """處理輸出格式變化"""
@@ -1240,28 +2841,42 @@ class AudioRepeaterGUI:
     def _handle_file_selection(self, values: Dict) -> None:
         """處理檔案選擇"""
         file_path = values['-FILE-']
+        self._last_calc = (None, None, 0)  # 重新選擇檔案後需重新計算
         
         if not file_path:
             self.window['-DURATION-'].update('未選擇檔案', text_color='gray')
             return
 
-        if not os.path.exists(file_path):
+        st = self._stat_file(file_path)
+        if st is None:
             self.window['-DURATION-'].update('檔案不存在', text_color='red')
             return
 
-        self._process_audio_file(file_path)
+        self._process_audio_file(file_path, st)
 
-    def _process_audio_file(self, file_path: str) -> None:
+    def _process_audio_file(self, file_path: str,
+                            st: Optional[os.stat_result] = None) -> None:
         """處理音訊檔案"""
         self.window['-DURATION-'].update('讀取中...', text_color='orange')
-        self.window.refresh()
+        self._dur_executor.submit(self._load_duration, file_path, st)
+
+    def _load_duration(self, file_path: str,
+                       st: Optional[os.stat_result] = None) -> None:
+        """背景讀取音訊時長並回傳至事件循環"""
+        duration = self.repeater.get_audio_duration(file_path, st)
+        self.window.write_event_value('-DURATION_DONE-', (file_path, duration))
+
+    def _handle_duration_done(self, values: Dict) -> None:
+        """處理背景時長讀取完成事件"""
+        file_path, duration = values['-DURATION_DONE-']
+        if file_path != values['-FILE-']:
+            return  # 使用者已改選其他檔案
 
-        duration = self.repeater.get_audio_duration(file_path)
         if duration:
             self._display_audio_info(file_path, duration)
         else:
             self.window['-DURATION-'].update('無法讀取', text_color='red')
-            self.window['-OUTPUT-'].print('錯誤: 無法讀取音訊檔案')
+            self._log('錯誤: 無法讀取音訊檔案')
 
     def _display_audio_info(self, file_path: str, duration: float) -> None:
         """顯示音訊檔案資訊"""
@@ -1270,12 +2885,12 @@ class AudioRepeaterGUI:
         duration_text = f'{minutes}分{seconds}秒 ({duration:.2f}秒)'
         self.window['-DURATION-'].update(duration_text, text_color='green')
 
-        input_ext = os.path.splitext(file_path)[1].lower().lstrip('.')
+        input_ext = _audio_ext(file_path)
         input_format = input_ext.upper()
 
-        has_ffmpeg = (os.path.exists(FFMPEG_EXE) or shutil.which('ffmpeg'))
+        has_ffmpeg = self.repeater.has_ffmpeg
 
-        if input_ext in ['mp3', 'wav', 'm4a', 'flac', 'ogg']:
+        if input_ext in _OUTPUT_FORMAT_SET:
             self._set_output_format(input_ext, file_path, input_format, 
                                   minutes, seconds, has_ffmpeg)
         else:
@@ -1291,28 +2906,29 @@ class AudioRepeaterGUI:
         self.window['-FILE_EXT-'].update('.mp3')
         
         filename = os.path.basename(file_path)
-        self.window['-OUTPUT-'].print(f'已載入檔案: {filename}')
-        time_info = f'檔案格式: {input_format}, 時長: {minutes}分{seconds}秒'
-        self.window['-OUTPUT-'].print(time_info)
+        lines = [
+            f'已載入檔案: {filename}',
+            f'檔案格式: {input_format}, 時長: {minutes}分{seconds}秒',
+        ]
 
         # 固定顯示mp3格式訊息
         if has_ffmpeg:
-            self.window['-OUTPUT-'].print('輸出格式已設為: mp3 (使用 FFmpeg 轉換)')
+            lines.append('輸出格式已設為: mp3 (使用 FFmpeg 轉換)')
         else:
-            self.window['-OUTPUT-'].print('輸出格式已設為: mp3 (需要 FFmpeg 支援)')
-            self.window['-OUTPUT-'].print(
-                f'警告: 無 ffmpeg，{input_format} 格式無法正確處理！')
-            self.window['-OUTPUT-'].print('建議: 改選 WAV 格式或安裝 ffmpeg')
+            lines.append('輸出格式已設為: mp3 (需要 FFmpeg 支援)')
+            lines.append(f'警告: 無 ffmpeg，{input_format} 格式無法正確處理！')
+            lines.append('建議: 改選 WAV 格式或安裝 ffmpeg')
+        self._log('\n'.join(lines))
 
     def _display_unsupported_format(self, file_path: str, input_format: str, 
                                    minutes: int, seconds: int) -> None:
         """顯示不支援的格式資訊"""
         filename = os.path.basename(file_path)
-        self.window['-OUTPUT-'].print(f'已載入檔案: {filename}')
-        time_info = f'檔案格式: {input_format}, 時長: {minutes}分{seconds}秒'
-        self.window['-OUTPUT-'].print(time_info)
-        self.window['-OUTPUT-'].print(
-            f'注意: 不支援 {input_format} 直接輸出，請選擇其他格式')
+        self._log('\n'.join([
+            f'已載入檔案: {filename}',
+            f'檔案格式: {input_format}, 時長: {minutes}分{seconds}秒',
+            f'注意: 不支援 {input_format} 直接輸出，請選擇其他格式',
+        ]))
 
     def _handle_calculate_repeat(self, values: Dict) -> None:
         """處理計算重複次數"""
@@ -1320,118 +2936,185 @@ class AudioRepeaterGUI:
         target_time = values['-TARGET_TIME-']
 
         if not file_path:
-            self.window['-OUTPUT-'].print('錯誤: 請選擇音訊檔案')
+            self._log('錯誤: 請選擇音訊檔案')
             return
 
         if not target_time:
-            self.window['-OUTPUT-'].print('錯誤: 請輸入目標時間')
+            self._log('錯誤: 請輸入目標時間')
             return
 
         try:
-            target_minutes = float(target_time)
-            duration = self.repeater.get_audio_duration(file_path)
+            target_minutes = self._parse_target_minutes(target_time)
+        except ValueError as e:
+            self._log(f'錯誤: {str(e)}')
+            return
 
-            if duration:
-                self._display_calculation_results(file_path, target_minutes, 
-                                                duration, values)
-            else:
-                self.window['-OUTPUT-'].print('錯誤: 無法讀取音訊檔案時長')
+        duration = self.repeater.get_audio_duration(file_path)
+        if not duration:
+            self._log('錯誤: 無法讀取音訊檔案時長')
+            return
+
+        try:
+            repeat_count = self._display_calculation_results(
+                file_path, target_minutes, duration, values)
+        except ValueError as e:
+            self._log(f'錯誤: {str(e)}')  # 音訊時長過短等無法計算的情況
+            return
+        self._last_calc = (file_path, target_time, repeat_count)
 
+    def _parse_target_minutes(self, target_time: str) -> float:
+        """
+        解析目標時間（分鐘），輸入未變時沿用上次結果
+
+        Raises:
+            ValueError: 不是有效數字或不大於 0 時（訊息可直接顯示）
+        """
+        if target_time == self._last_target[0]:
+            return self._last_target[1]
+        try:
+            target_minutes = float(target_time)
         except ValueError:
-            self.window['-OUTPUT-'].print('錯誤: 請輸入有效的數字')
+            raise ValueError("請輸入有效的數字") from None
+        if not math.isfinite(target_minutes):
+            raise ValueError("請輸入有效的數字")
+        if target_minutes <= 0:
+            raise ValueError("目標時間必須大於 0")
+        self._last_target = (target_time, target_minutes)
+        return target_minutes
 
     def _display_calculation_results(self, file_path: str, target_minutes: float,
-                                   duration: float, values: Dict) -> None:
-        """顯示計算結果"""
+                                   duration: float, values: Dict) -> int:
+        """顯示計算結果，返回重複次數"""
         repeat_count = self.repeater.calculate_repeat_count(duration, target_minutes)
         actual_duration = (duration * repeat_count) / 60
 
         self.window['-REPEAT_COUNT-'].update(str(repeat_count))
         
-        input_format = os.path.splitext(file_path)[1].lower().lstrip('.')
+        input_format = _audio_ext(file_path)
         output_format = values['-OUTPUT_FORMAT-'].lower()
         is_lossless = (input_format == output_format)
 
-        self.window['-OUTPUT-'].print('計算結果:')
-        self.window['-OUTPUT-'].print(f'  原檔案格式: {input_format.upper()}')
-        self.window['-OUTPUT-'].print(f'  輸出格式: {output_format.upper()}')
-        
         processing_type = "無損複製 (最快)" if is_lossless else "格式轉換 (較慢)"
-        self.window['-OUTPUT-'].print(f'  處理方式: {processing_type}')
-        
-        self.window['-OUTPUT-'].print(f'  原檔案時長: {duration:.2f}秒')
-        self.window['-OUTPUT-'].print(f'  目標時間: {target_minutes}分鐘')
-        self.window['-OUTPUT-'].print(f'  需要重複: {repeat_count}次')
-        self.window['-OUTPUT-'].print(f'  實際總時長: {actual_duration:.2f}分鐘')
+        lines = [
+            '計算結果:',
+            f'  原檔案格式: {input_format.upper()}',
+            f'  輸出格式: {output_format.upper()}',
+            f'  處理方式: {processing_type}',
+            f'  原檔案時長: {duration:.2f}秒',
+            f'  目標時間: {target_minutes}分鐘',
+            f'  需要重複: {repeat_count}次',
+            f'  實際總時長: {actual_duration:.2f}分鐘',
+        ]
         
         if not is_lossless:
-            self.window['-OUTPUT-'].print(
-                f'  提示: 選擇 {input_format.upper()} 格式可獲得最佳速度')
+            lines.append(f'  提示: 選擇 {input_format.upper()} 格式可獲得最佳速度')
         
-        self.window['-OUTPUT-'].print('-' * 40)
+        lines.append('-' * 40)
+        self._log('\n'.join(lines))
+        return repeat_count
 
     def _handle_generate_file(self, values: Dict) -> None:
         """處理生成檔案"""
         required_fields = ['-FILE-', '-TARGET_TIME-', '-OUTPUT_NAME-', '-OUTPUT_DIR-']
         if not all(values[field] for field in required_fields):
-            self.window['-OUTPUT-'].print('錯誤: 請填寫所有必要欄位')
+            self._log('錯誤: 請填寫所有必要欄位')
+            return
+
+        if self._generating:
+            self._log('錯誤: 正在生成檔案，請稍候')
             return
 
         try:
             self._generate_audio_file(values)
-        except ValueError:
-            self.window['-OUTPUT-'].print('錯誤: 請輸入有效的數字')
+        except ValueError as e:
+            self._log(f'錯誤: {str(e)}')
         except Exception as e:
-            self.window['-OUTPUT-'].print(f'錯誤: {str(e)}')
+            self._log(f'錯誤: {str(e)}')
 
     def _generate_audio_file(self, values: Dict) -> None:
         """生成音訊檔案"""
         file_path = values['-FILE-']
-        target_minutes = float(values['-TARGET_TIME-'])
-        output_name = values['-OUTPUT_NAME-']
-        output_dir = values['-OUTPUT_DIR-']
+        target_time = values['-TARGET_TIME-']
         output_format = values['-OUTPUT_FORMAT-']
+        output_file = self._compose_output_path(values)
 
-        output_file = os.path.join(output_dir, f"{output_name}.{output_format}")
+        if self._last_calc[:2] == (file_path, target_time):
+            repeat_count = self._last_calc[2]  # 剛計算過，不需重新讀取時長
+        else:
+            target_minutes = self._parse_target_minutes(target_time)
+            duration = self.repeater.get_audio_duration(file_path)
+            if not duration:
+                self._log('錯誤: 無法讀取音訊檔案')
+                return
+            try:
+                repeat_count = self.repeater.calculate_repeat_count(
+                    duration, target_minutes)
+            except ValueError as e:
+                self._log(f'錯誤: {str(e)}')  # 與目標時間格式錯誤分開回報
+                return
 
-        duration = self.repeater.get_audio_duration(file_path)
-        if not duration:
-            self.window['-OUTPUT-'].print('錯誤: 無法讀取音訊檔案')
-            return
+        self._log(f'開始生成檔案...\n重複次數: {repeat_count}')
 
-        repeat_count = self.repeater.calculate_repeat_count(duration, target_minutes)
+        self._generating = True
+        self._progress_step = -1
+        self._gen_executor.submit(self._generate_worker, file_path, 
+                                  repeat_count, output_file, output_format)
 
-        self.window['-OUTPUT-'].print('開始生成檔案...')
-        self.window['-OUTPUT-'].print(f'重複次數: {repeat_count}')
-        self.window.refresh()
+    def _generate_worker(self, file_path: str, repeat_count: int,
+                         output_file: str, output_format: str) -> None:
+        """背景生成音訊檔案，結果經由 -GEN_DONE- 事件回傳 GUI"""
+        try:
+            result = self.repeater.create_repeated_audio(
+                file_path, repeat_count, output_file, output_format,
+                progress_callback=self._report_generation_progress)
+        except Exception as e:
+            result = (False, f'錯誤: {str(e)}', None)
+        self.window.write_event_value('-GEN_DONE-', result)
 
-        success, message, actual_output_path = self.repeater.create_repeated_audio(
-            file_path, repeat_count, output_file, output_format)
+    def _report_generation_progress(self, percent: float) -> None:
+        """回報 FFmpeg 處理進度（每 10% 送出一次事件）"""
+        step = int(percent // 10)
+        if step <= self._progress_step:
+            return
+        self._progress_step = step
+        self.window.write_event_value('-GEN_PROGRESS-', step * 10)
+
+    def _handle_gen_progress(self, values: Dict) -> None:
+        """顯示生成進度"""
+        self._log(f"處理進度: {values['-GEN_PROGRESS-']}%")
 
+    def _handle_gen_done(self, values: Dict) -> None:
+        """處理背景生成完成事件"""
+        self._generating = False
+        success, message, actual_output_path = values['-GEN_DONE-']
         if success and actual_output_path:
             self._handle_successful_generation(actual_output_path, values)
         else:
-            self.window['-OUTPUT-'].print(message)
+            self._log(message)
 
     def _handle_successful_generation(self, actual_output_path: str, 
                                     values: Dict) -> None:
         """處理成功生成檔案"""
-        actual_size = os.path.getsize(actual_output_path) / BYTES_TO_MB
-        self.window['-OUTPUT-'].print(f'檔案大小: {actual_size:.2f} MB')
+        st = self._stat_file(actual_output_path)
+        if st is None:
+            self._log('錯誤: 找不到生成的檔案')
+            return
+        self._log(f'檔案大小: {st.st_size / BYTES_TO_MB:.2f} MB')
 
         if values['-AUTO_COPY-']:
-            self.window['-OUTPUT-'].print('正在自動複製到媒體...')
-            self.window.refresh()
-            copy_success = self._copy_to_media(actual_output_path)
-            if copy_success:
-                self.window['-OUTPUT-'].print('自動複製完成！')
-            else:
-                self.window['-OUTPUT-'].print('自動複製失敗，可手動複製')
+            self._log('正在自動複製到媒體...')
+            if not self._copy_to_media(actual_output_path, auto=True):
+                self._log('自動複製失敗，可手動複製')
+
+    def _stat_file(self, path: str) -> Optional[os.stat_result]:
+        """取得檔案狀態（一次系統呼叫同時判斷存在與大小），不存在時返回 None"""
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
 
     def _handle_contact_info(self, values: Dict) -> None:
         """處理聯絡資訊按鈕點擊"""
-        import FreeSimpleGUI as sg
-        
         contact_text = """如有程式修改或使用上的問題，
 請聯絡：at7263@ntpc.gov.tw
 感謝您的使用！"""
@@ -1444,6 +3127,9 @@ class AudioRepeaterGUI:
         """清理資源"""
         if self.media_manager:
             self.media_manager.stop_monitoring()
+        self._dur_executor.shutdown(wait=False)
+        self._copy_executor.shutdown(wait=False)
+        self._gen_executor.shutdown(wait=False)
         self.window.close()
 
 